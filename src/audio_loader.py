@@ -2,22 +2,110 @@
 Audio loader module - Load and validate audio files
 Supports multiple audio formats: MP3, WAV, FLAC, M4A, AAC, OGG, etc.
 """
+import functools
+import io
 import os
+import shutil
+import struct
+import subprocess
 
+import numpy as np
 from pydub import AudioSegment
 from pydub.utils import mediainfo
 
+try:
+    import av
+except ImportError:
+    av = None
+
+
+def _wav_header(data_size: int, sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """Build a canonical 44-byte PCM WAV header"""
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b"data", data_size,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _probe(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Probe a file with ffprobe (via pydub's mediainfo).
+    mtime_ns and size are part of the cache key so a changed file is re-probed.
+    """
+    info = mediainfo(file_path)
+    return {
+        'format': info.get('format_name', 'unknown'),
+        'codec': info.get('codec_name', 'unknown'),
+        'duration': float(info.get('duration', 0)),
+        'bit_rate': info.get('bit_rate', 'unknown'),
+        'sample_rate': info.get('sample_rate', 'unknown'),
+        'channels': info.get('channels', 'unknown')
+    }
+
+
+# SubFormat GUID of integer PCM in a WAVE_FORMAT_EXTENSIBLE fmt chunk
+_KSDATAFORMAT_SUBTYPE_PCM = b"\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+
+
+def wav_pcm_layout(wav_path: str) -> tuple:
+    """
+    Find the PCM payload of a WAV file by walking its RIFF chunks.
+    FFmpeg writes a LIST chunk before 'data', so the header is not always 44 bytes.
+
+    Returns:
+        Tuple of (sample_rate, channels, sample_width, data_offset, data_size)
+
+    Raises:
+        ValueError: If the file is not a WAV file of integer PCM samples
+    """
+    file_size = os.path.getsize(wav_path)
+    try:
+        with open(wav_path, "rb") as f:
+            riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+            if riff != b"RIFF" or wave_id != b"WAVE":
+                raise ValueError(f"Not a WAV file: {wav_path}")
+
+            fmt = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError(f"No data chunk in WAV file: {wav_path}")
+                chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+                if chunk_id == b"fmt ":
+                    fmt = struct.unpack("<HHIIHH", f.read(16))
+                    rest = f.read(max(0, chunk_size - 16) + (chunk_size & 1))
+                    # 0xFFFE = WAVE_FORMAT_EXTENSIBLE: the sample type is in SubFormat
+                    if fmt[0] == 0xFFFE and rest[8:24] == _KSDATAFORMAT_SUBTYPE_PCM:
+                        fmt = (1, *fmt[1:])
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        raise ValueError(f"WAV data chunk before fmt chunk: {wav_path}")
+                    if fmt[0] != 1:
+                        raise ValueError(f"WAV file is not integer PCM (format {fmt[0]:#x}): {wav_path}")
+                    _, channels, sample_rate, _, _, bits = fmt
+                    offset = f.tell()
+                    return sample_rate, channels, bits // 8, offset, min(chunk_size, file_size - offset)
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), 1)
+    except struct.error:
+        raise ValueError(f"Truncated WAV file: {wav_path}")
+
 
 class AudioLoader:
     """Load and convert audio files for transcription"""
 
-    SUPPORTED_FORMATS = {
+    SUPPORTED_FORMATS: frozenset[str] = frozenset({
         # Audio
         '.mp3', '.wav', '.flac', '.m4a', '.aac',
         '.ogg', '.wma', '.aiff', '.opus', '.amr', '.au', '.ra',
         # Video
         '.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv', '.m4v', '.3gp'
-    }
+    })
 
     def __init__(self, target_sample_rate: int = 16000):
         """
@@ -38,18 +126,19 @@ class AudioLoader:
         Returns:
             True if format is supported, False otherwise
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in self.SUPPORTED_FORMATS
-
-    def load_audio(self, file_path: str) -> AudioSegment:
-        """
-        Load audio file
+        return self._ext(file_path) in self.SUPPORTED_FORMATS
 
-        Args:
-            file_path: Path to audio file
+    @staticmethod
+    def _ext(path: str) -> str:
+        """Lowercased file extension, without the tuple os.path.splitext builds"""
+        i = path.rfind('.')
+        if i <= max(path.rfind('/'), path.rfind('\\')):
+            return ''
+        return path[i:].lower()
 
-        Returns:
-            AudioSegment object
+    def _validate_file(self, file_path: str) -> None:
+        """
+        Check that a file exists and has a supported format
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -66,13 +155,63 @@ class AudioLoader:
                 f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
             )
 
+    def _load_via_av(self, file_path: str) -> np.ndarray:
+        """
+        Decode audio with PyAV straight to mono int16 at the target sample rate
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            1-D int16 ndarray of samples
+        """
+        pieces = []
+        with av.open(file_path) as container:
+            stream = container.streams.audio[0]
+            resampler = av.AudioResampler(format="s16", layout="mono", rate=self.target_sample_rate)
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    pieces.append(resampled.to_ndarray().reshape(-1))
+            # Flush samples buffered inside the resampler
+            for resampled in resampler.resample(None):
+                pieces.append(resampled.to_ndarray().reshape(-1))
+
+        if not pieces:
+            return np.zeros(0, dtype=np.int16)
+        return np.concatenate(pieces)
+
+    def load_audio(self, file_path: str):
+        """
+        Load audio file
+
+        Decodes with PyAV when it is installed, otherwise with pydub.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            int16 ndarray (mono, target sample rate) when decoded with PyAV,
+            otherwise an AudioSegment object
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is not supported
+        """
+        self._validate_file(file_path)
+
         try:
             # Load audio file
             print(f"📂 Loading audio: {os.path.basename(file_path)}")
+            if av is not None:
+                audio = self._load_via_av(file_path)
+                duration = len(audio) / self.target_sample_rate
+                print(f"   Duration: {duration:.2f}s | Channels: 1 | Sample Rate: {self.target_sample_rate}Hz")
+                return audio
+
             audio = AudioSegment.from_file(file_path)
 
-            # Get audio info
-            duration = len(audio) / 1000.0  # Convert to seconds
+            # Get audio info (probe result is cached, so this is usually free)
+            duration = self.get_audio_info(file_path).get('duration') or len(audio) / 1000.0
             channels = audio.channels
             frame_rate = audio.frame_rate
 
@@ -83,12 +222,12 @@ class AudioLoader:
         except Exception as e:
             raise ValueError(f"Failed to load audio file: {e}")
 
-    def convert_to_wav(self, audio: AudioSegment, output_path: str = None) -> str:
+    def convert_to_wav(self, audio, output_path: str = None) -> str:
         """
         Convert audio to WAV format
 
         Args:
-            audio: AudioSegment object
+            audio: AudioSegment object, or int16 ndarray from load_audio()
             output_path: Output WAV file path (optional)
 
         Returns:
@@ -97,66 +236,197 @@ class AudioLoader:
         if output_path is None:
             import tempfile
             temp_dir = tempfile.gettempdir()
-            output_path = os.path.join(temp_dir, "audio_transcriber_temp.wav")
-
-        # Resample if needed
+            output_path = os.path.join(temp_dir, f"audio_transcriber_temp_{os.getpid()}.wav")
+
+        # PyAV output is already mono at the target rate: write it as-is
+        if isinstance(audio, np.ndarray):
+            try:
+                with open(output_path, "wb") as f:
+                    f.write(_wav_header(audio.nbytes, self.target_sample_rate, 1, audio.itemsize))
+                    audio.tofile(f)
+                print(f"✅ Converted to WAV: {output_path}")
+                return output_path
+            except Exception as e:
+                raise ValueError(f"Failed to convert to WAV: {e}")
+
+        # Resampling is left to FFmpeg/PyAV; pydub's interpolation is slow and lossy
         if audio.frame_rate != self.target_sample_rate:
-            print(f"   Resampling from {audio.frame_rate}Hz to {self.target_sample_rate}Hz...")
-            audio = audio.set_frame_rate(self.target_sample_rate)
+            raise ValueError(
+                f"Cannot resample from {audio.frame_rate}Hz to {self.target_sample_rate}Hz: "
+                "install FFmpeg or PyAV (pip install av)"
+            )
 
         # Convert to mono if stereo (speech recognition typically works better with mono)
         if audio.channels > 1:
             print(f"   Converting from {audio.channels} channels to mono...")
             audio = audio.set_channels(1)
 
+        # Downstream memory-mapping expects 16-bit samples
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+
         # Export as WAV
         try:
-            audio.export(output_path, format="wav")
+            self._write_wav_fast(audio, output_path)
             print(f"✅ Converted to WAV: {output_path}")
             return output_path
         except Exception as e:
             raise ValueError(f"Failed to convert to WAV: {e}")
 
+    def _write_wav_fast(self, audio: AudioSegment, path: str) -> None:
+        """
+        Write an AudioSegment as WAV: the header, then raw_data as is,
+        bypassing pydub's export machinery
+        """
+        raw_data = audio.raw_data
+        header = _wav_header(len(raw_data), audio.frame_rate, audio.channels, audio.sample_width)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(raw_data)
+
+    def _ffmpeg_to_wav(self, src: str, dst: str, sr: int, channels: int) -> None:
+        """
+        Decode, resample and downmix in a single native FFmpeg pass.
+        Resampling uses libsoxr when FFmpeg was built with it.
+
+        Args:
+            src: Path to input audio/video file
+            dst: Output WAV file path
+            sr: Target sample rate in Hz
+            channels: Target number of channels
+
+        Raises:
+            ValueError: If FFmpeg fails to convert the file
+        """
+        soxr = ["-af", "aresample=resampler=soxr:precision=20"]
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-i", src,
+            *soxr,
+            "-ac", str(channels),
+            "-ar", str(sr),
+            "-acodec", "pcm_s16le",
+            "-f", "wav", dst,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            # FFmpeg builds without libsoxr fail with a generic "resampling
+            # engine is unavailable" error: retry with the default resampler,
+            # which also surfaces any other error on its own
+            cmd = [arg for arg in cmd if arg not in soxr]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"FFmpeg conversion failed: {result.stderr.strip()}")
+
     def load_and_convert(self, file_path: str, output_path: str = None) -> tuple:
         """
         Load audio file and convert to WAV format
 
+        Uses a single direct FFmpeg call when the binary is available,
+        falling back to load_audio() + convert_to_wav() otherwise.
+
         Args:
             file_path: Path to input audio file
             output_path: Output WAV file path (optional)
 
         Returns:
-            Tuple of (AudioSegment, wav_file_path, duration)
+            Tuple of (audio, wav_file_path, duration) where audio is an
+            AudioSegment, an int16 ndarray when decoded with PyAV, or None
+            when the WAV was produced by FFmpeg or the input is already a
+            matching WAV, so no samples were decoded
         """
-        # Load audio
+        # Already 16-bit mono WAV at the target rate: nothing to convert
+        info = self.get_audio_info(file_path)
+        if (
+            info.get('format') == 'wav'
+            and info.get('codec') == 'pcm_s16le'
+            and str(info.get('sample_rate')) == str(self.target_sample_rate)
+            and str(info.get('channels')) == '1'
+        ):
+            self._validate_file(file_path)
+            print(f"📂 Loading audio: {os.path.basename(file_path)}")
+            wav_path = file_path
+            if output_path is not None:
+                shutil.copyfile(file_path, output_path)
+                wav_path = output_path
+            print(f"   Duration: {info['duration']:.2f}s | Already {self.target_sample_rate}Hz mono WAV, skipping conversion")
+            return None, wav_path, info['duration']
+
+        if shutil.which("ffmpeg"):
+            self._validate_file(file_path)
+
+            if output_path is None:
+                import tempfile
+                output_path = os.path.join(tempfile.gettempdir(), f"audio_transcriber_temp_{os.getpid()}.wav")
+
+            print(f"📂 Loading audio: {os.path.basename(file_path)}")
+            self._ffmpeg_to_wav(file_path, output_path, self.target_sample_rate, 1)
+
+            # Duration from the WAV header alone; the samples are never decoded here
+            sample_rate, channels, sample_width, _, data_size = wav_pcm_layout(output_path)
+            duration = data_size / (sample_rate * channels * sample_width)
+            print(f"   Duration: {duration:.2f}s | Channels: {channels} | Sample Rate: {sample_rate}Hz")
+            print(f"✅ Converted to WAV: {output_path}")
+
+            return None, output_path, duration
+
+        # Fallback: decode in-process and re-export
         audio = self.load_audio(file_path)
 
         # Convert to WAV
         wav_path = self.convert_to_wav(audio, output_path)
 
         # Get duration
-        duration = len(audio) / 1000.0  # Convert to seconds
+        if isinstance(audio, np.ndarray):
+            duration = len(audio) / self.target_sample_rate
+        else:
+            duration = len(audio) / 1000.0  # Convert to seconds
 
         return audio, wav_path, duration
 
-    def split_to_chunks(self, audio: AudioSegment, chunk_duration_sec: int) -> list:
+    def as_memmap(self, wav_path: str) -> tuple:
         """
-        Split audio into chunks of specified duration
+        Memory-map the PCM samples of a 16-bit WAV file without decoding it.
+        The returned array can be sliced freely; slices are views, not copies.
+
+        Args:
+            wav_path: Path to 16-bit PCM WAV file
+
+        Returns:
+            Tuple of (int16 ndarray, sample_rate). Shape is (n_frames,) for
+            mono and (n_frames, channels) otherwise.
+        """
+        sample_rate, channels, sample_width, offset, data_size = wav_pcm_layout(wav_path)
+        if sample_width != 2:
+            raise ValueError(f"Expected 16-bit PCM WAV, got {sample_width * 8}-bit: {wav_path}")
+
+        n_frames = data_size // (sample_width * channels)
+        shape = (n_frames,) if channels == 1 else (n_frames, channels)
+        if n_frames == 0:
+            return np.zeros(shape, dtype=np.int16), sample_rate
+
+        pcm = np.memmap(wav_path, dtype=np.int16, mode="r", offset=offset, shape=shape)
+        return pcm, sample_rate
+
+    def split_to_chunks(self, audio: AudioSegment, chunk_duration_sec: int) -> list[tuple[int, int, float]]:
+        """
+        Split audio into chunks of specified duration.
+        Only the chunk boundaries are computed; slice with audio[start_ms:end_ms]
+        when a chunk is actually needed, so the PCM data isn't copied up front.
 
         Args:
             audio: AudioSegment object
             chunk_duration_sec: Duration of each chunk in seconds
 
         Returns:
-            List of tuples: (AudioSegment chunk, start_offset_seconds)
+            List of tuples: (start_ms, end_ms, start_offset_seconds)
         """
         chunk_duration_ms = chunk_duration_sec * 1000
-        chunks = []
-        for start_ms in range(0, len(audio), chunk_duration_ms):
-            end_ms = min(start_ms + chunk_duration_ms, len(audio))
-            chunk = audio[start_ms:end_ms]
-            chunks.append((chunk, start_ms / 1000.0))
-        return chunks
+        total_ms = len(audio)
+        return [
+            (start_ms, min(start_ms + chunk_duration_ms, total_ms), start_ms / 1000.0)
+            for start_ms in range(0, total_ms, chunk_duration_ms)
+        ]
 
     def save_chunk(self, chunk: AudioSegment, chunk_index: int, compress: bool = True) -> str:
         """
@@ -176,17 +446,103 @@ class AudioLoader:
         temp_dir = tempfile.gettempdir()
 
         if compress:
-            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{chunk_index}.ogg")
+            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{os.getpid()}_{chunk_index}.ogg")
             chunk.export(chunk_path, format="ogg", codec="libopus", bitrate="32k")
         else:
-            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{chunk_index}.wav")
+            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{os.getpid()}_{chunk_index}.wav")
             chunk.export(chunk_path, format="wav")
 
         return chunk_path
 
+    def chunk_to_wav_bytes(self, pcm: np.ndarray, sample_rate: int) -> bytes:
+        """
+        Wrap a slice of PCM samples in a WAV header, entirely in memory
+
+        Args:
+            pcm: int16 samples, e.g. a slice of as_memmap() output
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Complete WAV file contents
+        """
+        channels = pcm.shape[1] if pcm.ndim > 1 else 1
+        buf = io.BytesIO()
+        buf.write(_wav_header(pcm.nbytes, sample_rate, channels, pcm.itemsize))
+        buf.write(pcm.tobytes())
+        return buf.getvalue()
+
+    def extract_chunk_ffmpeg(self, wav_path: str, start_s: float, end_s: float,
+                             chunk_index: int, compress: bool = True) -> str:
+        """
+        Cut a time range out of a WAV file with a single FFmpeg call.
+        Seeking is done on the input so no samples are copied in Python.
+
+        Args:
+            wav_path: Path to the source WAV file
+            start_s: Chunk start time in seconds
+            end_s: Chunk end time in seconds
+            chunk_index: Index number for unique filename
+            compress: If True, encode as OGG Opus. If False, write WAV.
+
+        Returns:
+            Path to temporary audio file
+
+        Raises:
+            ValueError: If FFmpeg fails to extract the chunk
+        """
+        proc, chunk_path = self.start_chunk_ffmpeg(wav_path, start_s, end_s, chunk_index, compress)
+        return self.finish_chunk_ffmpeg(proc, chunk_path)
+
+    def start_chunk_ffmpeg(self, wav_path: str, start_s: float, end_s: float,
+                           chunk_index: int, compress: bool = True) -> tuple:
+        """
+        Launch the FFmpeg extraction for a chunk without waiting for it,
+        so the next chunk can be cut while the current one is transcribed.
+        Pass the result to finish_chunk_ffmpeg() to collect the file.
+
+        Returns:
+            Tuple of (process, chunk_path)
+        """
+        import tempfile
+        temp_dir = tempfile.gettempdir()
+
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-ss", f"{start_s:.3f}", "-t", f"{end_s - start_s:.3f}",
+            "-i", wav_path,
+            "-ac", "1", "-ar", str(self.target_sample_rate),
+        ]
+        if compress:
+            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{os.getpid()}_{chunk_index}.ogg")
+            cmd += ["-c:a", "libopus", "-b:a", "32k", "-f", "ogg", chunk_path]
+        else:
+            chunk_path = os.path.join(temp_dir, f"transcriber_chunk_{os.getpid()}_{chunk_index}.wav")
+            cmd += ["-c:a", "pcm_s16le", "-f", "wav", chunk_path]
+
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        return proc, chunk_path
+
+    @staticmethod
+    def finish_chunk_ffmpeg(proc: subprocess.Popen, chunk_path: str) -> str:
+        """
+        Wait for an extraction started by start_chunk_ffmpeg().
+
+        Returns:
+            Path to temporary audio file
+
+        Raises:
+            ValueError: If FFmpeg fails to extract the chunk
+        """
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise ValueError(f"FFmpeg chunk extraction failed: {stderr.strip()}")
+
+        return chunk_path
+
     def get_audio_info(self, file_path: str) -> dict:
         """
-        Get audio file information without loading the entire file
+        Get audio file information without loading the entire file.
+        Results are cached per (path, mtime, size) for the lifetime of the process.
 
         Args:
             file_path: Path to audio file
@@ -195,14 +551,9 @@ class AudioLoader:
             Dictionary with audio info
         """
         try:
-            info = mediainfo(file_path)
-            return {
-                'format': info.get('format_name', 'unknown'),
-                'duration': float(info.get('duration', 0)),
-                'bit_rate': info.get('bit_rate', 'unknown'),
-                'sample_rate': info.get('sample_rate', 'unknown'),
-                'channels': info.get('channels', 'unknown')
-            }
+            stat = os.stat(file_path)
+            # Copy so callers can't mutate the cached entry
+            return dict(_probe(file_path, stat.st_mtime_ns, stat.st_size))
         except Exception as e:
             return {
                 'error': str(e)
@@ -41,6 +41,23 @@ MAX_OUTPUT_TOKENS = 8192
 # Recommended: 300 (5 min) for speech-heavy, 600 (10 min) for sparse audio
 CHUNK_DURATION = 300
 
+# Number of Gemini requests in flight at once
+# Higher values finish long files faster but may hit API rate limits
+# This is the total: batch mode splits it across its worker processes,
+# running at most CONCURRENCY files in parallel
+# Can be overridden with the TRANSCRIBER_CONCURRENCY environment variable
+CONCURRENCY = 3
+
+# Number of audio chunks sent together in a single Gemini request
+# Batching amortizes per-request overhead; lower it if responses get truncated
+CHUNKS_PER_REQUEST = 8
+
+# Compress audio chunks before upload
+# False = raw WAV sent inline from memory (no re-encoding, no temp files)
+# True = OGG Opus via FFmpeg, uploaded as files (~8x smaller uploads)
+# Inline requests are limited to ~20 MB: lower CHUNKS_PER_REQUEST if needed
+COMPRESS_CHUNKS = False
+
 # =============================================================================
 # AUDIO PROCESSING SETTINGS
 # =============================================================================
@@ -52,6 +69,11 @@ SAMPLE_RATE = 16000
 # Mono is sufficient for speech and reduces file size
 CHANNELS = 1
 
+# Voice activity detection method
+# 'ffmpeg' = FFmpeg silencedetect filter (fast, native)
+# 'energy' = built-in Python RMS energy analysis (no FFmpeg needed)
+VAD_METHOD = 'ffmpeg'
+
 # =============================================================================
 # OUTPUT SETTINGS
 # =============================================================================
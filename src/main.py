@@ -4,14 +4,31 @@ Generate SRT subtitles from audio files using Google Gemini 2.0
 """
 
 import argparse
+import asyncio
+import concurrent.futures
+import difflib
+import itertools
+import multiprocessing
 import os
+import queue
+import re
 import sys
 import time
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import config
 from audio_loader import AudioLoader
 from config import (
     CLEAN_TEMP_FILES,
@@ -24,16 +41,86 @@ from config import (
 )
 from srt_generator import SRTGenerator
 from transcriber import Transcriber
-from vad import find_speech_regions, group_regions, regions_to_segments
+from vad import (
+    chunk_with_overlap,
+    find_speech_regions,
+    find_speech_regions_ffmpeg,
+    regions_to_segments,
+)
+
+
+# Settings added after config.example.py was first published; a config.py
+# copied from an older example doesn't have them
+CONCURRENCY = getattr(config, "CONCURRENCY", 3)
+CHUNKS_PER_REQUEST = getattr(config, "CHUNKS_PER_REQUEST", 8)
+COMPRESS_CHUNKS = getattr(config, "COMPRESS_CHUNKS", False)
+VAD_METHOD = getattr(config, "VAD_METHOD", "ffmpeg")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _total_concurrency():
+    """Gemini requests allowed in flight at once, across all batch workers"""
+    return max(1, int(os.environ.get("TRANSCRIBER_CONCURRENCY", CONCURRENCY)))
+
+
+def _wait_until_complete(path, settle=2.0):
+    """
+    Block until a file's size stops changing for `settle` seconds.
+
+    Returns:
+        False if the file disappeared meanwhile, True otherwise
+    """
+    last_size = None
+    while True:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return False
+        if size == last_size:
+            return True
+        last_size = size
+        time.sleep(settle)
+
+
+def _tokens(text):
+    """(offset, lowercased word) tokens used to align overlapping transcripts"""
+    return [(m.start(), m.group().lower()) for m in _WORD_RE.finditer(text)]
+
+
+class NewFileHandler(FileSystemEventHandler):
+    """Queue paths of new files in the watched folder that match the watched extensions"""
+
+    def __init__(self, extensions: frozenset, pending: queue.Queue):
+        super().__init__()
+        self.extensions = extensions
+        self.pending = pending
+
+    def _enqueue(self, path: str):
+        if AudioLoader._ext(path) in self.extensions:
+            self.pending.put(str(Path(path)))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        # Files renamed or moved into the folder (e.g. after a download finishes)
+        if not event.is_directory:
+            self._enqueue(event.dest_path)
 
 
 class AudioTranscriberApp:
     """Main application class for Audio Transcriber"""
 
-    def __init__(self):
+    def __init__(self, show_progress: bool = True, concurrency: int = None):
         self.audio_loader = AudioLoader(target_sample_rate=SAMPLE_RATE)
         self.transcriber = Transcriber()
         self.srt_generator = SRTGenerator()
+        # Off in batch worker processes, which share one terminal
+        self.show_progress = show_progress
+        # Gemini requests in flight per file; batch workers get a share of the total
+        self.concurrency = concurrency if concurrency is not None else _total_concurrency()
 
     def transcribe_file(self, input_file: str, output_file: str = None, target_lang: str = None, is_bilingual: bool = False) -> str:
         """
@@ -41,10 +128,10 @@ class AudioTranscriberApp:
 
         Pipeline:
         1. Convert audio to WAV
-        2. VAD detects speech regions (accurate timestamps from audio energy)
-        3. Group regions into chunks, extract audio per chunk
-        4. Gemini transcribes each chunk (text only, no timestamps)
-        5. Combine VAD timestamps + Gemini text → SRT
+        2. VAD detects speech regions (used to skip silent chunks)
+        3. Split audio into fixed-length chunks with a small overlap
+        4. Gemini transcribes the chunks in parallel
+        5. Merge overlapping chunk transcripts → SRT
         """
         try:
             if VERBOSE:
@@ -54,96 +141,76 @@ class AudioTranscriberApp:
 
             audio, wav_path, duration = self.audio_loader.load_and_convert(input_file)
 
+            # One shared view of the PCM samples for VAD and chunk extraction
+            pcm, sample_rate = self.audio_loader.as_memmap(wav_path)
+
             if VERBOSE:
                 print(f"\n📊 Audio Information:")
                 print(f"   Duration: {duration:.2f} seconds")
-                print(f"   Sample Rate: {audio.frame_rate} Hz")
-            
+                print(f"   Sample Rate: {sample_rate} Hz")
+                print(f"   Channels: {pcm.shape[1] if pcm.ndim > 1 else 1}")
+
             # Disable text wrapping for bilingual mode to keep 1 line per language
             if is_bilingual:
                 self.srt_generator.max_chars_per_line = 2000
             else:
                 self.srt_generator.max_chars_per_line = 40  # Reset to default
-                print(f"   Channels: {audio.channels}")
 
             # Step 1: VAD - detect speech regions from audio energy
             print(f"\n🔍 Detecting speech regions (VAD)...")
-            regions = find_speech_regions(wav_path)
+            regions = None
+            if VAD_METHOD == "ffmpeg":
+                try:
+                    regions = find_speech_regions_ffmpeg(wav_path, duration)
+                except (OSError, RuntimeError) as e:
+                    print(f"   FFmpeg silence detection unavailable ({e}), using energy VAD")
+            if regions is None:
+                regions = find_speech_regions(pcm, sample_rate=sample_rate)
             total_speech = sum(e - s for s, e in regions)
             mins_s, secs_s = divmod(int(total_speech), 60)
             print(f"   Found {len(regions)} speech regions ({mins_s}m{secs_s:02d}s of speech)")
 
             if not regions:
                 print("   No speech detected in audio")
-                if CLEAN_TEMP_FILES:
+                del pcm
+                if CLEAN_TEMP_FILES and wav_path != input_file:
                     try:
                         os.remove(wav_path)
                     except Exception:
                         pass
                 return None
 
-            # Step 2: Group regions into API-friendly chunks
-            groups = group_regions(regions, max_group_duration=30.0)
-            print(f"   Grouped into {len(groups)} chunks for transcription")
+            # Step 2: Split into overlapping chunks, skipping fully silent ones
+            groups = [
+                {"start": start, "end": end}
+                for start, end in chunk_with_overlap(duration)
+                if any(r_start < end and r_end > start for r_start, r_end in regions)
+            ]
+            print(f"   Split into {len(groups)} overlapping chunks for transcription")
 
-            # Step 3: Transcribe each group with Gemini (text only)
+            # Step 3: Transcribe groups concurrently with Gemini
             print(f"\n🤖 Transcribing with Gemini 2.0...")
-            all_segments = []
-
-            for i, group in enumerate(groups):
-                chunk_num = i + 1
-                label = f"Chunk {chunk_num}/{len(groups)}"
-                group_regions_list = group["regions"]
-
-                # Extract group audio
-                start_ms = int(group["start"] * 1000)
-                end_ms = int(group["end"] * 1000)
-                chunk_audio = audio[start_ms:end_ms]
-
-                # Save chunk to temp WAV
-                chunk_wav = self.audio_loader.save_chunk(chunk_audio, i)
-
-                try:
-                    # Get segments directly from transcriber (handles translation/bilingual)
-                    chunk_segments = self.transcriber.transcribe(
-                        chunk_wav, 
-                        chunk_duration=min(30.0, duration), 
-                        label=label,
-                        target_lang=target_lang,
-                        is_bilingual=is_bilingual
-                    )
-
-                    # Adjust timestamps to be relative to the full audio
-                    # chunk_segments timestamps are 0-based for the chunk
-                    # we need to add the group's start time to align with original audio
-                    start_offset = group["start"]
-                    for segment in chunk_segments:
-                        segment["start"] += start_offset
-                        segment["end"] += start_offset
-                        
-                        # Add language labels for bilingual mode if translation exists
-                        if is_bilingual and "\n" in segment["text"]:
-                            parts = segment["text"].split("\n", 1)
-                            if len(parts) == 2:
-                                original = parts[0]
-                                translation = parts[1]
-                                # Format: Original (Grey) on new line, Translation on next line
-                                # Using standard SRT font color tag
-                                segment["text"] = f'<font color="#808080">{original}</font>\n{translation}'
-                    
-                    all_segments.extend(chunk_segments)
-
-                except Exception as e:
-                    print(f"   [{label}] Failed: {e}")
-                finally:
-                    if CLEAN_TEMP_FILES:
-                        try:
-                            os.remove(chunk_wav)
-                        except Exception:
-                            pass
+            chunk_results = asyncio.run(
+                self._transcribe_groups_async(
+                    wav_path, pcm, sample_rate, groups, target_lang, is_bilingual, self.concurrency
+                )
+            )
+            all_segments = self._merge_chunk_segments(groups, chunk_results, is_bilingual)
 
-            # Clean up temp WAV
-            if CLEAN_TEMP_FILES:
+            # Add language labels for bilingual mode if translation exists
+            if is_bilingual:
+                for segment in all_segments:
+                    if "\n" in segment["text"]:
+                        original, translation = segment["text"].split("\n", 1)
+                        # Format: Original (Grey) on new line, Translation on next line
+                        # Using standard SRT font color tag
+                        segment["text"] = f'<font color="#808080">{original}</font>\n{translation}'
+
+            # Release the memory map before deleting the WAV it points to
+            del pcm
+
+            # Clean up temp WAV (never the input itself when it was used as-is)
+            if CLEAN_TEMP_FILES and wav_path != input_file:
                 try:
                     os.remove(wav_path)
                 except Exception:
@@ -183,6 +250,203 @@ class AudioTranscriberApp:
                 traceback.print_exc()
             return None
 
+    async def _transcribe_groups_async(self, wav_path, pcm, sample_rate, groups, target_lang, is_bilingual, concurrency):
+        """
+        Extract and transcribe all groups, packing up to CHUNKS_PER_REQUEST
+        groups into each Gemini request and running at most `concurrency`
+        requests at a time.
+
+        Returns:
+            One segment list per group, in group order, with timestamps
+            relative to the full audio
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        indexed = iter(enumerate(groups))
+        batches = []
+        while batch := list(itertools.islice(indexed, max(1, CHUNKS_PER_REQUEST))):
+            batches.append(batch)
+
+        # Several requests in flight would fight over the spinner line
+        self.transcriber.show_progress = self.show_progress and (concurrency <= 1 or len(batches) <= 1)
+
+        # Chunks whose FFmpeg extraction is already running, by batch index.
+        # While a batch is with Gemini the next batch is being cut on disk.
+        # `started` keeps a batch from being extracted again after it has
+        # taken its entry out of `prefetched`.
+        prefetched = {}
+        started = set()
+
+        def _discard(extractions):
+            for proc, _ in extractions:
+                proc.wait()
+            if CLEAN_TEMP_FILES:
+                for _, chunk_path in extractions:
+                    try:
+                        os.remove(chunk_path)
+                    except Exception:
+                        pass
+
+        def _start_extraction(k):
+            if not COMPRESS_CHUNKS or k >= len(batches) or k in started:
+                return
+            started.add(k)
+            extractions = prefetched[k] = []
+            try:
+                for i, group in batches[k]:
+                    extractions.append(
+                        self.audio_loader.start_chunk_ffmpeg(wav_path, group["start"], group["end"], i)
+                    )
+            except OSError:
+                # Undo the partial start so the batch can retry on its own
+                del prefetched[k]
+                started.discard(k)
+                _discard(extractions)
+                raise
+
+        async def _transcribe_one(k, batch):
+            first, last = batch[0][0] + 1, batch[-1][0] + 1
+            if first == last:
+                label = f"Chunk {first}/{len(groups)}"
+            else:
+                label = f"Chunks {first}-{last}/{len(groups)}"
+
+            async with semaphore:
+                chunks = []
+                extractions = []
+                try:
+                    if COMPRESS_CHUNKS:
+                        # Cut and encode group audio straight from the converted WAV
+                        _start_extraction(k)
+                        extractions = prefetched.pop(k)
+                        for proc, chunk_path in extractions:
+                            chunks.append(await asyncio.to_thread(
+                                self.audio_loader.finish_chunk_ffmpeg, proc, chunk_path
+                            ))
+                        try:
+                            _start_extraction(k + 1)
+                        except OSError:
+                            pass  # the next batch will retry and report it
+                    else:
+                        for _, group in batch:
+                            # Wrap the group's samples from the shared PCM view, no temp file
+                            start_sample = int(group["start"] * sample_rate)
+                            end_sample = int(group["end"] * sample_rate)
+                            chunks.append(self.audio_loader.chunk_to_wav_bytes(
+                                pcm[start_sample:end_sample], sample_rate
+                            ))
+
+                    # Get segments directly from transcriber (handles translation/bilingual)
+                    batch_segments = await asyncio.to_thread(
+                        self.transcriber.transcribe_batch,
+                        chunks,
+                        chunk_durations=[group["end"] - group["start"] for _, group in batch],
+                        label=label,
+                        target_lang=target_lang,
+                        is_bilingual=is_bilingual
+                    )
+
+                    for (_, group), chunk_segments in zip(batch, batch_segments):
+                        # Adjust timestamps to be relative to the full audio
+                        # chunk_segments timestamps are 0-based for the chunk
+                        # we need to add the group's start time to align with original audio
+                        start_offset = group["start"]
+                        for segment in chunk_segments:
+                            segment["start"] += start_offset
+                            segment["end"] += start_offset
+
+                    return batch_segments
+
+                except Exception as e:
+                    print(f"   [{label}] Failed: {e}")
+                    return [[] for _ in batch]
+                finally:
+                    _discard(extractions)
+
+        try:
+            results = await asyncio.gather(*(_transcribe_one(k, batch) for k, batch in enumerate(batches)))
+        finally:
+            # Extractions no batch picked up
+            for extractions in prefetched.values():
+                _discard(extractions)
+        return [chunk_segments for batch_segments in results for chunk_segments in batch_segments]
+
+    def _merge_chunk_segments(self, groups, chunk_results, is_bilingual=False):
+        """
+        Merge per-chunk segments from overlapping chunks into one timeline.
+
+        In each overlap, the transcribed words of the previous chunk's tail
+        and the next chunk's head are aligned with difflib; the middle of the
+        longest matching run is the join point. The two segments holding it
+        are spliced at that word: the tail segment keeps the words before it
+        and the head segment the words from it on, so no speech is dropped.
+        Falls back to the middle of the overlap when the texts don't line up,
+        clipping segments that cross it.
+
+        Bilingual texts ("original\ntranslation") are aligned and spliced on
+        the original line only; each translation stays with its original.
+        """
+        def original(text):
+            return text.partition("\n")[0] if is_bilingual else text
+
+        merged = []
+        prev_end = None
+
+        for group, segments in zip(groups, chunk_results):
+            if prev_end is None or not merged or group["start"] >= prev_end:
+                merged.extend(segments)
+                prev_end = group["end"]
+                continue
+
+            overlap_start, overlap_end = group["start"], prev_end
+            tail_idx = [i for i, seg in enumerate(merged) if seg["end"] > overlap_start]
+            head_idx = [i for i, seg in enumerate(segments) if seg["start"] < overlap_end]
+
+            tail_tokens = [(i, *t) for i in tail_idx for t in _tokens(original(merged[i]["text"]))]
+            head_tokens = [(i, *t) for i in head_idx for t in _tokens(original(segments[i]["text"]))]
+
+            matcher = difflib.SequenceMatcher(
+                a=[t for _, _, t in tail_tokens], b=[t for _, _, t in head_tokens], autojunk=False
+            )
+            a, b, size = max(matcher.get_matching_blocks(), key=lambda m: m.size)
+
+            if not tail_idx:
+                # Nothing of the previous chunk reaches into the overlap
+                merged.extend(segments)
+            elif size >= 2:
+                # Cut at the word in the middle of the agreeing run: the
+                # previous chunk's text up to it, the next chunk's from it on.
+                # Offsets fall in the first line, so a translation line after
+                # it stays with the head's part of the original
+                cut_tail, tail_pos, _ = tail_tokens[a + size // 2]
+                cut_head, head_pos, _ = head_tokens[b + size // 2]
+                head = dict(segments[cut_head], text=segments[cut_head]["text"][head_pos:])
+                tail = merged[cut_tail]
+                del merged[cut_tail:]
+                before = tail["text"][:tail_pos].rstrip()
+                if before:
+                    if is_bilingual:
+                        before += tail["text"][len(original(tail["text"])):]
+                    end = max(tail["start"], min(tail["end"], head["start"]))
+                    merged.append(dict(tail, text=before, end=end))
+                merged.append(head)
+                merged.extend(segments[cut_head + 1:])
+            else:
+                # Segments crossing the midpoint are clipped to it, not dropped
+                midpoint = (overlap_start + overlap_end) / 2
+                merged = [
+                    seg if seg["end"] <= midpoint else dict(seg, end=midpoint)
+                    for seg in merged if seg["start"] < midpoint
+                ]
+                merged.extend(
+                    seg if seg["start"] >= midpoint else dict(seg, start=midpoint)
+                    for seg in segments if seg["end"] > midpoint
+                )
+
+            prev_end = group["end"]
+
+        return merged
+
     def _distribute_texts(self, regions, texts):
         """
         Distribute texts across regions when counts don't match.
@@ -191,25 +455,26 @@ class AudioTranscriberApp:
         if not texts or not regions:
             return []
 
-        full_text = " ".join(t.strip() for t in texts if t and t.strip())
+        full_text = " ".join(t.strip() for t in texts if t and not t.isspace())
         words = full_text.split()
         if not words:
             return []
 
-        total_duration = sum(e - s for s, e in regions)
+        durations = np.fromiter((e - s for s, e in regions), dtype=np.float64, count=len(regions))
+        total_duration = durations.sum()
         if total_duration <= 0:
             return []
 
+        # Word count per region proportional to its duration, as slice bounds
+        counts = np.maximum(1, np.round(len(words) * durations / total_duration).astype(np.int64))
+        ends = np.cumsum(counts).tolist()
+
         segments = []
         word_idx = 0
 
-        for start, end in regions:
-            region_dur = end - start
-            proportion = region_dur / total_duration
-            word_count = max(1, round(len(words) * proportion))
-
-            region_words = words[word_idx:word_idx + word_count]
-            word_idx += word_count
+        for (start, end), word_end in zip(regions, ends):
+            region_words = words[word_idx:word_end]
+            word_idx = word_end
 
             if region_words:
                 segments.append({
@@ -247,30 +512,57 @@ class AudioTranscriberApp:
         if output_dir:
             print(f"📁 Output directory: {output_dir}")
 
-        successful_files = []
-
-        for i, input_file in enumerate(input_files, 1):
-            print(f"\n{'=' * 60}")
-            print(f"File {i}/{len(input_files)}")
-            print(f"{'=' * 60}")
-
+        jobs = []
+        for input_file in input_files:
             # Determine output file path
             input_path = Path(input_file)
             if output_dir:
                 output_path = Path(output_dir) / input_path.with_suffix(".srt").name
             else:
                 output_path = input_path.with_suffix(".srt")
+            jobs.append((input_file, str(output_path)))
 
-            # Transcribe
-            result = self.transcribe_file(
-                input_file,
-                str(output_path),
-                target_lang=target_lang,
-                is_bilingual=is_bilingual
-            )
+        results = [None] * len(jobs)
+        # Workers split the Gemini concurrency between them, so the total
+        # number of requests in flight stays at CONCURRENCY
+        total_concurrency = _total_concurrency()
+        max_workers = max(1, min(len(jobs), (os.cpu_count() or 2) // 2, total_concurrency))
+
+        if max_workers == 1:
+            for i, (input_file, output_file) in enumerate(jobs):
+                print(f"\n{'=' * 60}")
+                print(f"File {i + 1}/{len(jobs)}")
+                print(f"{'=' * 60}")
+
+                # Transcribe
+                results[i] = self.transcribe_file(
+                    input_file,
+                    output_file,
+                    target_lang=target_lang,
+                    is_bilingual=is_bilingual
+                )
+        else:
+            # One file per worker process; each worker builds its own Gemini client
+            print(f"⚡ Processing up to {max_workers} files in parallel")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(VERBOSE, CLEAN_TEMP_FILES, False, total_concurrency // max_workers),
+            ) as pool:
+                futures = {
+                    pool.submit(_transcribe_in_worker, input_file, output_file, target_lang, is_bilingual): i
+                    for i, (input_file, output_file) in enumerate(jobs)
+                }
+                for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        print(f"\n❌ Worker failed on {jobs[i][0]}: {e}")
+                    print(f"\n📦 Finished {done}/{len(jobs)}: {Path(jobs[i][0]).name}")
 
-            if result:
-                successful_files.append(result)
+        successful_files = [result for result in results if result]
 
         # Summary
         print(f"\n{'=' * 60}")
@@ -289,7 +581,8 @@ class AudioTranscriberApp:
 
     def watch_folder(self, watch_dir: str, output_dir: str = None):
         """
-        Watch folder for new audio files and auto-transcribe
+        Watch folder for new audio files and auto-transcribe.
+        Uses filesystem events (watchdog) when installed, polling otherwise.
 
         Args:
             watch_dir: Directory to watch for audio files
@@ -301,46 +594,86 @@ class AudioTranscriberApp:
         print(f"   Watching: {watch_dir}")
         print(f"   Output: {output_dir if output_dir else 'Same as input'}")
         print(f"   Extensions: {WATCH_EXTENSIONS}")
-        print(f"   Interval: {WATCH_INTERVAL}s")
+        if Observer is None:
+            print(f"   Interval: {WATCH_INTERVAL}s")
         print(f"\n🔄 Waiting for audio files... (Press Ctrl+C to stop)")
 
         if output_dir:
             Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        # Track processed files
+        # Absolute paths so scan results and watchdog events compare equal
+        watch_dir = os.path.abspath(watch_dir)
+        ext_set = frozenset(ext.strip().lower() for ext in WATCH_EXTENSIONS.split(","))
+
+        # Track processed files (also de-duplicates rapid create/rename events)
         processed_files = set()
 
+        def process(audio_file: Path):
+            # Events arrive as soon as a file is created, while a copy or
+            # download may still be writing it: wait until it stops growing
+            if not _wait_until_complete(audio_file):
+                return
+
+            print(f"\n{'=' * 60}")
+            print(f"🎉 New audio file detected: {audio_file.name}")
+            print(f"{'=' * 60}")
+
+            # Determine output file
+            if output_dir:
+                output_file = str(
+                    Path(output_dir)
+                    / audio_file.with_suffix(".srt").name
+                )
+            else:
+                output_file = str(audio_file.with_suffix(".srt"))
+
+            # Transcribe
+            self.transcribe_file(str(audio_file), output_file)
+
+            # Mark as processed
+            processed_files.add(str(audio_file))
+
+        def scan():
+            # One directory listing per tick instead of a glob per extension
+            with os.scandir(watch_dir) as entries:
+                new_files = [
+                    entry.path for entry in entries
+                    if AudioLoader._ext(entry.name) in ext_set
+                    and entry.path not in processed_files
+                    and entry.is_file()
+                ]
+            for path in new_files:
+                yield Path(path)
+
         try:
-            while True:
-                # Scan directory for audio files
-                watch_path = Path(watch_dir)
-                extensions = WATCH_EXTENSIONS.split(",")
-
-                for ext in extensions:
-                    ext = ext.strip()
-                    for audio_file in watch_path.glob(f"*{ext}"):
-                        if str(audio_file) not in processed_files:
-                            print(f"\n{'=' * 60}")
-                            print(f"🎉 New audio file detected: {audio_file.name}")
-                            print(f"{'=' * 60}")
-
-                            # Determine output file
-                            if output_dir:
-                                output_file = str(
-                                    Path(output_dir)
-                                    / audio_file.with_suffix(".srt").name
-                                )
-                            else:
-                                output_file = str(audio_file.with_suffix(".srt"))
-
-                            # Transcribe
-                            self.transcribe_file(str(audio_file), output_file)
-
-                            # Mark as processed
-                            processed_files.add(str(audio_file))
-
-                # Wait before next scan
-                time.sleep(WATCH_INTERVAL)
+            if Observer is None:
+                while True:
+                    for audio_file in scan():
+                        process(audio_file)
+
+                    # Wait before next scan
+                    time.sleep(WATCH_INTERVAL)
+
+            pending = queue.Queue()
+            observer = Observer()
+            observer.schedule(NewFileHandler(ext_set, pending), watch_dir, recursive=False)
+            observer.start()
+            try:
+                # Pick up files that were already there before watching started
+                for audio_file in scan():
+                    pending.put(str(audio_file))
+
+                while True:
+                    try:
+                        path = pending.get(timeout=1.0)
+                    except queue.Empty:
+                        # Wake up periodically so Ctrl+C is handled on Windows
+                        continue
+                    if path not in processed_files:
+                        process(Path(path))
+            finally:
+                observer.stop()
+                observer.join()
 
         except KeyboardInterrupt:
             print(f"\n\n👋 Watch mode stopped")
@@ -430,7 +763,7 @@ Examples:
         print(
             f"Language: {args.language.upper() if args.language != 'auto' else 'Auto-detect'}"
         )
-        print(f"Pipeline: VAD timestamps + Gemini text")
+        print(f"Pipeline: overlapping chunks + Gemini timestamps")
 
         # Run appropriate mode
         if args.watch:
@@ -443,7 +776,7 @@ Examples:
                 item_path = Path(item)
                 if item_path.is_dir():
                     for f in sorted(item_path.iterdir()):
-                        if f.is_file() and self.audio_loader.is_supported_format(str(f)):
+                        if f.is_file() and self.audio_loader.is_supported_format(f.name):
                             expanded_files.append(str(f))
                     if not expanded_files:
                         print(f"❌ No supported audio/video files found in '{item}'")
@@ -461,6 +794,28 @@ Examples:
             sys.exit(1)
 
 
+# Per-process app instance for batch worker processes
+_worker_app = None
+
+
+def _init_worker(verbose: bool, clean_temp_files: bool, show_progress: bool, concurrency: int):
+    """Set up a batch worker process with its own app and Gemini client"""
+    global _worker_app, VERBOSE, CLEAN_TEMP_FILES
+    VERBOSE = verbose
+    CLEAN_TEMP_FILES = clean_temp_files
+    _worker_app = AudioTranscriberApp(show_progress=show_progress, concurrency=concurrency)
+
+
+def _transcribe_in_worker(input_file: str, output_file: str, target_lang: str, is_bilingual: bool) -> str:
+    """Transcribe one file inside a batch worker process"""
+    return _worker_app.transcribe_file(
+        input_file,
+        output_file,
+        target_lang=target_lang,
+        is_bilingual=is_bilingual
+    )
+
+
 def main():
     """Entry point"""
     app = AudioTranscriberApp()
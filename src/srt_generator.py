@@ -2,8 +2,11 @@
 SRT Generator module - Generate SRT subtitle format from transcription segments
 """
 
+import io
 import re
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
+
+_SRT_TS_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
 
 
 class SRTGenerator:
@@ -30,12 +33,13 @@ class SRTGenerator:
         Returns:
             Timestamp string in format HH:MM:SS,mmm
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
+        # Integer milliseconds, rounded so 2.3 doesn't come out as ,299
+        total_ms = int(seconds * 1000 + 0.5)
+        secs, millisecs = divmod(total_ms, 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, millisecs)
 
     def wrap_text(self, text: str) -> List[str]:
         """
@@ -53,46 +57,25 @@ class SRTGenerator:
                 
             words = paragraph.split()
             current_line = []
+            current_len = 0
             
             for word in words:
-                test_line = " ".join(current_line + [word])
-                if len(test_line) <= self.max_chars_per_line:
+                # Length the line would have with this word, without joining it
+                needed = current_len + (1 if current_line else 0) + len(word)
+                if needed <= self.max_chars_per_line:
                     current_line.append(word)
+                    current_len = needed
                 else:
                     if current_line:
                         final_lines.append(" ".join(current_line))
                     current_line = [word]
+                    current_len = len(word)
             
             if current_line:
                 final_lines.append(" ".join(current_line))
         
         return final_lines
 
-    def split_long_blocks(self, lines: List[str]) -> List[str]:
-        """
-        Split blocks that exceed maximum lines
-
-        Args:
-            lines: List of text lines
-
-        Returns:
-            List of blocks (each block is a string)
-        """
-        blocks = []
-        current_block = []
-
-        for line in lines:
-            current_block.append(line)
-            if len(current_block) >= self.max_lines_per_block:
-                blocks.append("\n".join(current_block))
-                current_block = []
-
-        # Add remaining lines
-        if current_block:
-            blocks.append("\n".join(current_block))
-
-        return blocks
-
     def generate_segment(self, index: int, start: float, end: float, text: str) -> str:
         """
         Generate a single SRT segment
@@ -114,24 +97,20 @@ class SRTGenerator:
         lines = self.wrap_text(text)
 
         # Build segment
-        segment = f"{index}\n"
-        segment += f"{start_time} --> {end_time}\n"
-        segment += "\n".join(lines) + "\n"
+        return "\n".join((str(index), f"{start_time} --> {end_time}", *lines, ""))
 
-        return segment
-
-    def generate_srt(self, segments: List[Dict]) -> str:
+    def iter_segments(self, segments: Iterable[Dict]) -> Iterator[str]:
         """
-        Generate complete SRT content from segments
+        Generate SRT content piece by piece, one subtitle block at a time
 
         Args:
-            segments: List of transcription segments
+            segments: Iterable of transcription segments
                      Each segment should have: 'start', 'end', 'text'
 
-        Returns:
-            Complete SRT content as string
+        Yields:
+            SRT text that concatenates to the complete file
         """
-        srt_lines = []
+        first = True
 
         for idx, segment in enumerate(segments, start=1):
             start_time = segment.get("start", 0)
@@ -139,27 +118,43 @@ class SRTGenerator:
             text = segment.get("text", "")
 
             # Skip empty segments
-            if not text.strip():
+            if not text or text.isspace():
                 continue
 
-            # Generate segment
-            segment_str = self.generate_segment(idx, start_time, end_time, text)
-            srt_lines.append(segment_str)
+            # Blank line between blocks
+            if not first:
+                yield "\n"
+            first = False
+            yield self.generate_segment(idx, start_time, end_time, text)
+
+    def generate_srt(self, segments: Iterable[Dict]) -> str:
+        """
+        Generate complete SRT content from segments
+
+        Args:
+            segments: Iterable of transcription segments
+                     Each segment should have: 'start', 'end', 'text'
 
-        return "\n".join(srt_lines)
+        Returns:
+            Complete SRT content as string
+        """
+        buf = io.StringIO()
+        buf.writelines(self.iter_segments(segments))
+        return buf.getvalue()
 
     def save_srt(self, segments: List[Dict], output_path: str) -> None:
         """
         Save SRT content to file
 
+        Blocks are streamed through a 1 MiB write buffer rather than
+        building the whole file in memory first.
+
         Args:
             segments: List of transcription segments
             output_path: Path to output SRT file
         """
-        srt_content = self.generate_srt(segments)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(srt_content)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(self.iter_segments(segments))
 
     def generate_with_overlapping(
         self, segments: List[Dict], overlap_duration: float = 0.5
@@ -174,16 +169,17 @@ class SRTGenerator:
         Returns:
             Complete SRT content as string
         """
-        # Adjust end times for overlap
-        adjusted_segments = []
-        for i, segment in enumerate(segments):
-            seg_copy = segment.copy()
-            if i < len(segments) - 1:
-                next_start = segments[i + 1].get("start", seg_copy["end"])
-                seg_copy["end"] = min(seg_copy["end"], next_start - overlap_duration)
-            adjusted_segments.append(seg_copy)
+        last = len(segments) - 1
+
+        def adjusted():
+            # Adjust end times for overlap, without copying each segment dict
+            for i, segment in enumerate(segments):
+                end = segment["end"]
+                if i < last:
+                    end = min(end, segments[i + 1].get("start", end) - overlap_duration)
+                yield {"start": segment.get("start", 0), "end": end, "text": segment.get("text", "")}
 
-        return self.generate_srt(adjusted_segments)
+        return self.generate_srt(adjusted())
 
 
 def format_time_to_srt(seconds: float) -> str:
@@ -231,7 +227,7 @@ def parse_srt_timestamp(timestamp: str) -> float:
     Returns:
         Time in seconds
     """
-    match = re.match(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})", timestamp)
+    match = _SRT_TS_RE.match(timestamp)
     if match:
         hours, minutes, seconds, millis = map(int, match.groups())
         return hours * 3600 + minutes * 60 + seconds + millis / 1000.0
@@ -3,48 +3,193 @@ Gemini 2.0 transcription module with timestamp support
 Transcribes audio files and returns segments with start/end times for SRT generation
 """
 
+import concurrent.futures
+import functools
 import json
 import os
+import re
 import sys
 import threading
 import time
+from types import MappingProxyType
 
 from config import GEMINI_API_KEY, LANGUAGE, MAX_OUTPUT_TOKENS, MODEL, TEMPERATURE
 from google import generativeai as genai
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# First JSON array in a response that has extra text around it
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Language code -> name used in prompts and listed as supported
+_LANGUAGE_NAMES = MappingProxyType({
+    "id": "Indonesian",
+    "en": "English",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "zh": "Chinese",
+    "ar": "Arabic",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "ru": "Russian",
+    "hi": "Hindi",
+    "th": "Thai",
+    "vi": "Vietnamese",
+    "ms": "Malay",
+    "nl": "Dutch",
+    "pl": "Polish",
+    "sv": "Swedish",
+    "tr": "Turkish",
+})
+
+# Prompt templates; only the language, task and duration parts vary per call
+_PROMPT_TEMPLATE = """
+            {lang_instruction}
+            {duration_hint}
+            {task_instruction}
+            
+            Use this JSON format for the response:
+            {json_template}
+            
+            Strictly follow this format. Do not include markdown code blocks.
+            Ensure timestamps are accurate.
+            """
+
+_BATCH_PROMPT_TEMPLATE = """
+            {lang_instruction}
+            You will receive {num_audios} separate audio segments, numbered from 0 in the order given.
+            Transcribe each audio segment separately. Timestamps restart at 0.0 for every audio segment.
+            {duration_hint}
+            For each audio segment: {task_instruction}
+            
+            Use this JSON format for the response, with one object per audio segment:
+            [{{"id": 0, "segments": {json_template}}}]
+            
+            Strictly follow this format. Do not include markdown code blocks.
+            Ensure timestamps are accurate.
+            """
+
+_TEXT_ONLY_PROMPT_TEMPLATE = """{lang_instruction}
+
+Transcribe the following audio. The audio contains {num_regions} speech segments separated by silence.
+Return the result as a JSON array of strings, where each element is the transcription of one speech segment, in order.
+
+Example for 3 segments:
+["First segment text here", "Second segment text here", "Third segment text here"]
+
+Requirements:
+- Return exactly {num_regions} strings in the array
+- Each string corresponds to one speech segment in chronological order
+- If a segment is unclear, transcribe your best guess
+- Return ONLY valid JSON array, no other text
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _prompt_parts(language: str, target_lang: str = None, is_bilingual: bool = False) -> tuple:
+    """
+    Build the language, task and JSON template parts of the prompt.
+    Cached, since they only depend on the language settings.
+
+    Returns:
+        Tuple of (lang_instruction, task_instruction, json_template)
+    """
+    lang_instruction = ""
+    if language and language != "auto":
+        lang_name = _LANGUAGE_NAMES.get(language, language)
+        lang_instruction = f"The audio is in {lang_name}."
+
+    # Construct the prompt based on mode
+    if target_lang:
+        target_lang_name = _LANGUAGE_NAMES.get(target_lang, target_lang)
+        if is_bilingual:
+            task_instruction = (
+                f"Transcribe the audio and translate it into {target_lang_name}. "
+                "For each segment, provide BOTH the original text and the translation. "
+                "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
+                "'text' (string, original text), and 'translation' (string, translated text)."
+            )
+        else:
+            task_instruction = (
+                f"Transcribe the audio and translate it directly into {target_lang_name}. "
+                "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
+                "and 'text' (string, translated text)."
+            )
+    else:
+        task_instruction = (
+            "Transcribe the audio perfectly. "
+            "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
+            "and 'text' (string)."
+        )
+
+    # Construct JSON template based on mode
+    if is_bilingual:
+        json_template = '[{"start": 0.0, "end": 2.5, "text": "Segment text", "translation": "Translated text"}]'
+    elif target_lang:
+        json_template = '[{"start": 0.0, "end": 2.5, "text": "Translated text"}]'
+    else:
+        json_template = '[{"start": 0.0, "end": 2.5, "text": "Segment text"}]'
+
+    return lang_instruction, task_instruction, json_template
+
+
+@functools.lru_cache(maxsize=None)
+def _text_only_lang_instruction(language: str) -> str:
+    """Language line for the text-only prompt"""
+    if language == "auto":
+        return "Detect the language automatically."
+    return f"Transcribe in {_LANGUAGE_NAMES.get(language, language)}."
+
 
 class ProgressIndicator:
     """Background spinner for long-running operations"""
 
-    def __init__(self, message: str):
+    SYMBOLS = (".", "..", "...", "....", ".....")
+
+    def __init__(self, message: str, enabled: bool = True):
         self.message = message
+        self.enabled = enabled
         self._stop = threading.Event()
         self._thread = None
 
     def start(self):
+        # Nobody sees a spinner in logs or CI, skip the thread entirely
+        if not self.enabled or not sys.stdout.isatty():
+            return
         self._stop.clear()
         self._thread = threading.Thread(target=self._spin, daemon=True)
         self._thread.start()
 
     def _spin(self):
-        symbols = [".", "..", "...", "....", "....."]
-        start_time = time.time()
+        prefix = f"\r   {self.message} "
+        symbols = self.SYMBOLS
+        start_time = time.monotonic()
         idx = 0
         while not self._stop.is_set():
-            elapsed = int(time.time() - start_time)
+            elapsed = int(time.monotonic() - start_time)
             mins, secs = divmod(elapsed, 60)
             time_str = f"{mins}m{secs:02d}s" if mins else f"{secs}s"
-            sys.stdout.write(f"\r   {self.message} {symbols[idx % len(symbols)]} ({time_str})   ")
+            sys.stdout.write(f"{prefix}{symbols[idx % len(symbols)]} ({time_str})   ")
             sys.stdout.flush()
             idx += 1
-            self._stop.wait(1.0)
+            self._stop.wait(2.0)
 
     def stop(self, final_message: str = None):
         self._stop.set()
         if self._thread:
             self._thread.join()
-        # Clear the entire line first to remove spinner remnants
-        sys.stdout.write("\r" + " " * 80 + "\r")
+            self._thread = None
+            # Clear the entire line first to remove spinner remnants
+            sys.stdout.write("\r" + " " * 80 + "\r")
         if final_message:
             sys.stdout.write(f"   {final_message}\n")
         sys.stdout.flush()
@@ -60,216 +205,322 @@ class Transcriber:
         self.language = LANGUAGE
         self.temperature = TEMPERATURE
         self.max_tokens = MAX_OUTPUT_TOKENS
+        # Spinners from concurrent calls would overwrite each other's line;
+        # with this off each call only prints its completion messages
+        self.show_progress = True
+
+    def _get_model(self):
+        """Validate the API key and return a configured Gemini model"""
+        if not self.api_key or self.api_key == "YOUR_API_KEY_HERE":
+            raise ValueError(
+                "GEMINI_API_KEY not set in config.py. Please edit src/config.py"
+            )
 
-    def transcribe(self, audio_path: str, chunk_duration: float = None, label: str = None, 
-                  target_lang: str = None, is_bilingual: bool = False) -> list:
+        genai.configure(api_key=self.api_key)
+        return genai.GenerativeModel(self.model_name)
+
+    def _upload(self, audio_path: str, label: str = None):
+        """Upload an audio file to Gemini with a progress spinner"""
+        prefix = f"   [{label}] " if label else "   "
+
+        # Show file size for context
+        file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+
+        upload_label = f"[{label}] Uploading" if label else "Uploading to Gemini API"
+        progress = ProgressIndicator(upload_label, self.show_progress)
+        progress.start()
+        audio_file = genai.upload_file(audio_path)
+        progress.stop(f"{prefix}Uploaded ({file_size_mb:.1f} MB)")
+        return audio_file
+
+    def _audio_part(self, audio, label: str = None, mime_type: str = "audio/wav") -> tuple:
+        """
+        Prepare audio for generate_content: raw bytes are sent inline,
+        file paths are uploaded through the File API.
+
+        Returns:
+            Tuple of (content part, uploaded file to delete afterwards or None)
+        """
+        if isinstance(audio, (bytes, bytearray)):
+            return {"mime_type": mime_type, "data": bytes(audio)}, None
+
+        audio_file = self._upload(audio, label)
+        return audio_file, audio_file
+
+    def _generate(self, model, contents: list, label: str = None, default_label: str = "Gemini is transcribing"):
+        """Run generate_content with a progress spinner and return response text"""
+        prefix = f"   [{label}] " if label else "   "
+        generation_config = {
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_tokens,
+            "response_mime_type": "application/json",
+        }
+
+        transcribe_label = f"[{label}] Transcribing" if label else default_label
+        progress = ProgressIndicator(transcribe_label, self.show_progress)
+        progress.start()
+        response = model.generate_content(contents, generation_config=generation_config)
+        progress.stop(f"{prefix}Transcription received!")
+        return response.text.strip()
+
+    def _prompt_parts(self, target_lang: str = None, is_bilingual: bool = False) -> tuple:
+        """
+        Build the language, task and JSON template parts of the prompt
+
+        Returns:
+            Tuple of (lang_instruction, task_instruction, json_template)
+        """
+        return _prompt_parts(self.language, target_lang, is_bilingual)
+
+    def _parse_json(self, text: str):
+        """Parse a JSON response, tolerating markdown fences and surrounding text"""
+        # Remove markdown if present
+        if text.startswith("```"):
+            # Drop the opening fence line (```json) without splitting the whole text
+            nl = text.find("\n")
+            text = text[nl + 1:] if nl != -1 else text[3:]
+            text = text.removesuffix("```").strip()
+
+        try:
+            return _json_loads(text)
+        except json.JSONDecodeError:
+            # Fallback: try to find array in text
+            match = _JSON_ARRAY_RE.search(text)
+            if match:
+                return _json_loads(match.group(0))
+            # Provide snippet for debugging
+            raise ValueError(f"Could not parse JSON response: {text[:200]}...")
+
+    def _format_segments(self, raw_segments: list, is_bilingual: bool, prefix: str) -> list:
+        """Validate raw segments from Gemini and normalize them to start/end/text dicts"""
+        segments = []
+        for i, s in enumerate(raw_segments):
+            # Ensure all required keys exist
+            if not isinstance(s, dict) or not ('start' in s and 'end' in s and 'text' in s):
+                print(f"{prefix}Warning: Skipping invalid segment at index {i} (missing keys)")
+                continue
+
+            # Type validation
+            if not isinstance(s['text'], str):
+                print(f"{prefix}Warning: Skipping segment {i} due to invalid 'text' type")
+                continue
+            try:
+                start = float(s['start'])
+                end = float(s['end'])
+            except (TypeError, ValueError):
+                print(f"{prefix}Warning: Skipping segment {i} due to invalid 'start'/'end' type")
+                continue
+
+            # Format text for bilingual mode
+            segment_text = s['text']
+            if is_bilingual and s.get('translation'):
+                segment_text = f"{s['text']}\n{s['translation']}"
+
+            segments.append({'start': start, 'end': end, 'text': segment_text})
+
+        return segments
+
+    def transcribe(self, audio, chunk_duration: float = None, label: str = None, 
+                  target_lang: str = None, is_bilingual: bool = False, mime_type: str = "audio/wav") -> list:
         """
         Transcribe audio file and return segments with timestamps
 
         Args:
-            audio_path: Path to audio file (WAV format)
+            audio: Path to audio file, or raw audio bytes sent inline
             chunk_duration: Duration of this chunk in seconds (for better prompting)
             label: Display label for progress (e.g. "Chunk 3/16")
             target_lang: Target language for translation (e.g. "id", "en")
             is_bilingual: If True, output both original and translated text
+            mime_type: MIME type of raw audio bytes (ignored for file paths)
 
         Returns:
             List of segments with 'start', 'end', and 'text' keys
         """
         audio_file = None
+        text = ""
         prefix = f"   [{label}] " if label else "   "
         try:
-            # Validate API key
-            if not self.api_key or self.api_key == "YOUR_API_KEY_HERE":
-                raise ValueError(
-                    "GEMINI_API_KEY not set in config.py. Please edit src/config.py"
-                )
-
-            # Initialize Gemini client
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model_name)
-
-            # Show file size for context
-            file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-
-            # Upload audio file with progress
-            upload_label = f"[{label}] Uploading" if label else "Uploading to Gemini API"
-            progress = ProgressIndicator(upload_label)
-            progress.start()
-            audio_file = genai.upload_file(audio_path)
-            progress.stop(f"{prefix}Uploaded ({file_size_mb:.1f} MB)")
+            model = self._get_model()
+            audio_part, audio_file = self._audio_part(audio, label, mime_type)
 
             # Build prompt
-            language_names = {
-                "id": "Indonesian",
-                "en": "English",
-                "ja": "Japanese",
-                "ko": "Korean",
-                "zh": "Chinese",
-                "ar": "Arabic",
-                "es": "Spanish",
-                "fr": "French",
-                "de": "German",
-                "it": "Italian",
-                "pt": "Portuguese",
-                "ru": "Russian",
-                "hi": "Hindi",
-                "th": "Thai",
-                "vi": "Vietnamese",
-            }
-            
-            lang_instruction = ""
-            if self.language and self.language != "auto":
-                lang_name = language_names.get(self.language, self.language)
-                lang_instruction = f"The audio is in {lang_name}."
-
-            # Construct the prompt based on mode
-            if target_lang:
-                target_lang_name = language_names.get(target_lang, target_lang)
-                if is_bilingual:
-                    task_instruction = (
-                        f"Transcribe the audio and translate it into {target_lang_name}. "
-                        "For each segment, provide BOTH the original text and the translation. "
-                        "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
-                        "'text' (string, original text), and 'translation' (string, translated text)."
-                    )
-                else:
-                    task_instruction = (
-                        f"Transcribe the audio and translate it directly into {target_lang_name}. "
-                        "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
-                        "and 'text' (string, translated text)."
-                    )
-            else:
-                task_instruction = (
-                    "Transcribe the audio perfectly. "
-                    "Return a JSON array of objects with keys: 'start' (float seconds), 'end' (float seconds), "
-                    "and 'text' (string)."
-                )
+            lang_instruction, task_instruction, json_template = self._prompt_parts(target_lang, is_bilingual)
 
             duration_hint = ""
             if chunk_duration:
                 duration_hint = f"\nThis audio is approximately {chunk_duration:.0f} seconds long. Timestamps must start near 0.0 and end near {chunk_duration:.0f}.\n"
 
+            prompt = _PROMPT_TEMPLATE.format(
+                lang_instruction=lang_instruction,
+                duration_hint=duration_hint,
+                task_instruction=task_instruction,
+                json_template=json_template,
+            )
+
+            text = self._generate(model, [prompt, audio_part], label)
+
+            # Cleanup now; finally only retries if this delete failed
+            if audio_file is not None:
+                try:
+                    genai.delete_file(audio_file.name)
+                    audio_file = None
+                except Exception:
+                    pass
+
+            # Parse JSON response
+            raw_segments = self._parse_json(text)
+            segments = self._format_segments(raw_segments, is_bilingual, prefix)
 
+            print(f"{prefix}Segments: {len(segments)}")
 
-            # Generate transcription with progress
-            generation_config = {
-                "temperature": self.temperature,
-                "max_output_tokens": self.max_tokens,
-                "response_mime_type": "application/json",
-            }
+            return segments
 
-            # Construct JSON template based on mode
-            if is_bilingual:
-                json_template = '[{"start": 0.0, "end": 2.5, "text": "Segment text", "translation": "Translated text"}]'
-            elif target_lang:
-                json_template = '[{"start": 0.0, "end": 2.5, "text": "Translated text"}]'
-            else:
-                json_template = '[{"start": 0.0, "end": 2.5, "text": "Segment text"}]'
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {e}\nResponse: {text}")
+        except Exception as e:
+            raise RuntimeError(f"Transcription error: {e}")
+        finally:
+            # Clean up uploaded file
+            if audio_file is not None:
+                try:
+                    genai.delete_file(audio_file.name)
+                except Exception:
+                    pass
 
-            prompt = f"""
-            {lang_instruction}
-            {duration_hint}
-            {task_instruction}
-            
-            Use this JSON format for the response:
-            {json_template}
-            
-            Strictly follow this format. Do not include markdown code blocks.
-            Ensure timestamps are accurate.
-            """
+    def transcribe_batch(self, audios: list, chunk_durations: list = None, label: str = None,
+                         target_lang: str = None, is_bilingual: bool = False, mime_type: str = "audio/wav") -> list:
+        """
+        Transcribe several audio chunks in a single Gemini request.
+        Amortizes per-request overhead; each chunk keeps its own 0-based timestamps.
+
+        Args:
+            audios: Audio chunks in order, each a file path or raw audio bytes
+            chunk_durations: Duration of each chunk in seconds (for better prompting)
+            label: Display label for progress (e.g. "Chunks 1-8/16")
+            target_lang: Target language for translation (e.g. "id", "en")
+            is_bilingual: If True, output both original and translated text
+            mime_type: MIME type of raw audio bytes (ignored for file paths)
+
+        Returns:
+            List with one segment list per input chunk, in input order
+        """
+        audio_files = []
+        text = ""
+        prefix = f"   [{label}] " if label else "   "
+        try:
+            model = self._get_model()
+            audio_parts = []
+            for audio in audios:
+                audio_part, audio_file = self._audio_part(audio, label, mime_type)
+                audio_parts.append(audio_part)
+                if audio_file is not None:
+                    audio_files.append(audio_file)
+
+            lang_instruction, task_instruction, json_template = self._prompt_parts(target_lang, is_bilingual)
+
+            duration_hint = ""
+            if chunk_durations:
+                duration_hint = "\n".join(
+                    f"Audio segment {i} is approximately {d:.0f} seconds long."
+                    for i, d in enumerate(chunk_durations)
+                )
 
-            transcribe_label = f"[{label}] Transcribing" if label else "Gemini is transcribing"
-            progress = ProgressIndicator(transcribe_label)
-            progress.start()
-            response = model.generate_content(
-                [prompt, audio_file], generation_config=generation_config
+            prompt = _BATCH_PROMPT_TEMPLATE.format(
+                lang_instruction=lang_instruction,
+                num_audios=len(audios),
+                duration_hint=duration_hint,
+                task_instruction=task_instruction,
+                json_template=json_template,
             )
-            progress.stop(f"{prefix}Transcription received!")
 
-            # Cleanup
-            try:
-                genai.delete_file(audio_file.name)
-            except Exception:
-                pass
+            text = self._generate(model, [prompt, *audio_parts], label)
 
-            # Parse JSON response
-            text = response.text.strip()
-            # Remove markdown if present
-            if text.startswith("```"):
-                lines = text.splitlines()
-                if lines[0].startswith("```"):
-                    lines = lines[1:]
-                if lines[-1].startswith("```"):
-                    lines = lines[:-1]
-                text = "\n".join(lines).strip()
-            
-            try:
-                raw_segments = json.loads(text)
-            except json.JSONDecodeError:
-                # Fallback: try to find array in text
-                import re
-                match = re.search(r'\[.*\]', text, re.DOTALL)
-                if match:
-                    raw_segments = json.loads(match.group(0))
-                else:
-                    # Provide snippet for debugging
-                    raise ValueError(f"Could not parse JSON response: {text[:200]}...")
-
-            # Validate and format segments
-            segments = []
-            for s in raw_segments:
-                if 'start' in s and 'end' in s and 'text' in s:
-                    # Format text for bilingual mode
-                    segment_text = s['text']
-                    if is_bilingual and 'translation' in s and s['translation']:
-                         segment_text = f"{s['text']}\n{s['translation']}"
-                    
-                    segments.append({
-                        'start': float(s['start']),
-                        'end': float(s['end']),
-                        'text': segment_text
-                    })
-            
-            # Validate segment structure
-            validated_segments = []
-            for i, segment in enumerate(segments):
-                # Ensure all required keys exist
-                if not all(key in segment for key in ["start", "end", "text"]):
-                    print(f"{prefix}Warning: Skipping invalid segment at index {i} (missing keys)")
-                    continue
-                
-                # Type validation
-                if not isinstance(segment.get("start"), (int, float)):
-                    print(f"{prefix}Warning: Skipping segment {i} due to invalid 'start' type")
+            # Parse JSON response and fan segments back out per chunk
+            raw_results = self._parse_json(text)
+            results = [[] for _ in audios]
+            placed = set()
+            for i, item in enumerate(raw_results):
+                if not isinstance(item, dict):
+                    print(f"{prefix}Warning: Skipping batch item {i} (not an object)")
                     continue
-                if not isinstance(segment.get("end"), (int, float)):
-                    print(f"{prefix}Warning: Skipping segment {i} due to invalid 'end' type")
-                    continue
-                if not isinstance(segment.get("text"), str):
-                    print(f"{prefix}Warning: Skipping segment {i} due to invalid 'text' type")
+                chunk_id = item.get("id", i)
+                # Models often return the id as a string or a float
+                if isinstance(chunk_id, str) and chunk_id.strip().isdigit():
+                    chunk_id = int(chunk_id)
+                elif isinstance(chunk_id, float) and chunk_id.is_integer():
+                    chunk_id = int(chunk_id)
+                if type(chunk_id) is not int or not 0 <= chunk_id < len(results):
+                    print(f"{prefix}Warning: Skipping batch item {i} with invalid id {chunk_id!r}")
                     continue
+                results[chunk_id] = self._format_segments(item.get("segments") or [], is_bilingual, prefix)
+                placed.add(chunk_id)
 
-                validated_segments.append(segment)
-            
-            segments = validated_segments
+            missing = [str(k) for k in range(len(results)) if k not in placed]
+            if missing:
+                print(f"{prefix}Warning: No result for audio segment(s) {', '.join(missing)}")
 
-            print(f"{prefix}Segments: {len(segments)}")
+            print(f"{prefix}Segments: {sum(len(r) for r in results)}")
 
-            return segments
+            return results
 
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse JSON response: {e}\nResponse: {text}")
         except Exception as e:
             raise RuntimeError(f"Transcription error: {e}")
         finally:
-            # Clean up uploaded file
-            if audio_file is not None:
+            # Clean up uploaded files
+            for audio_file in audio_files:
                 try:
                     genai.delete_file(audio_file.name)
                 except Exception:
                     pass
 
+    def transcribe_many(self, audios: list, chunk_durations: list = None, target_lang: str = None,
+                        is_bilingual: bool = False, mime_type: str = "audio/wav", max_workers: int = 8) -> list:
+        """
+        Transcribe independent audio chunks concurrently, one request per chunk.
+        Gemini calls are network-bound, so threads overlap the waiting.
+        Spinners are turned off while the calls run in parallel.
+
+        Args:
+            audios: Audio chunks in order, each a file path or raw audio bytes
+            chunk_durations: Duration of each chunk in seconds (for better prompting)
+            target_lang: Target language for translation (e.g. "id", "en")
+            is_bilingual: If True, output both original and translated text
+            mime_type: MIME type of raw audio bytes (ignored for file paths)
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            List with one segment list per input chunk, in input order.
+            A chunk that fails is reported and yields an empty list.
+        """
+        if not audios:
+            return []
+        durations = chunk_durations or [None] * len(audios)
+
+        show_progress = self.show_progress
+        self.show_progress = len(audios) == 1
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(audios)))) as executor:
+                futures = [
+                    executor.submit(
+                        self.transcribe, audio, duration, f"Chunk {i}/{len(audios)}",
+                        target_lang, is_bilingual, mime_type
+                    )
+                    for i, (audio, duration) in enumerate(zip(audios, durations), start=1)
+                ]
+
+                results = []
+                for i, future in enumerate(futures, start=1):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        print(f"   [Chunk {i}/{len(audios)}] Failed: {e}")
+                        results.append([])
+                return results
+        finally:
+            self.show_progress = show_progress
+
     def transcribe_text_only(self, audio_path: str, num_regions: int, label: str = None) -> list:
         """
         Transcribe audio and return ONLY text split into segments.
@@ -292,67 +543,17 @@ class Transcriber:
             genai.configure(api_key=self.api_key)
             model = genai.GenerativeModel(self.model_name)
 
-            file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-
-            upload_label = f"[{label}] Uploading" if label else "Uploading to Gemini API"
-            progress = ProgressIndicator(upload_label)
-            progress.start()
-            audio_file = genai.upload_file(audio_path)
-            progress.stop(f"{prefix}Uploaded ({file_size_mb:.1f} MB)")
-
-            language_names = {
-                "id": "Indonesian", "en": "English", "ja": "Japanese",
-                "ko": "Korean", "zh": "Chinese", "ar": "Arabic",
-                "es": "Spanish", "fr": "French", "de": "German",
-                "it": "Italian", "pt": "Portuguese", "ru": "Russian",
-                "hi": "Hindi", "th": "Thai", "vi": "Vietnamese",
-            }
-
-            if self.language == "auto":
-                lang_instruction = "Detect the language automatically."
-            else:
-                lang_name = language_names.get(self.language, self.language)
-                lang_instruction = f"Transcribe in {lang_name}."
-
-            prompt = f"""{lang_instruction}
-
-Transcribe the following audio. The audio contains {num_regions} speech segments separated by silence.
-Return the result as a JSON array of strings, where each element is the transcription of one speech segment, in order.
-
-Example for 3 segments:
-["First segment text here", "Second segment text here", "Third segment text here"]
+            audio_file = self._upload(audio_path, label)
 
-Requirements:
-- Return exactly {num_regions} strings in the array
-- Each string corresponds to one speech segment in chronological order
-- If a segment is unclear, transcribe your best guess
-- Return ONLY valid JSON array, no other text
-"""
-
-            generation_config = {
-                "temperature": self.temperature,
-                "max_output_tokens": self.max_tokens,
-                "response_mime_type": "application/json",
-            }
-
-            transcribe_label = f"[{label}] Transcribing" if label else "Gemini transcribing"
-            progress = ProgressIndicator(transcribe_label)
-            progress.start()
-            response = model.generate_content(
-                [prompt, audio_file], generation_config=generation_config
+            prompt = _TEXT_ONLY_PROMPT_TEMPLATE.format(
+                lang_instruction=_text_only_lang_instruction(self.language),
+                num_regions=num_regions,
             )
-            progress.stop(f"{prefix}Transcription received!")
 
-            text = response.text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
+            text = self._generate(model, [prompt, audio_file], label, "Gemini transcribing")
+            text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
-            result = json.loads(text)
+            result = _json_loads(text)
 
             if isinstance(result, list):
                 texts = [str(item) for item in result]
@@ -373,41 +574,20 @@ Requirements:
                 except Exception:
                     pass
 
-    def get_supported_languages(self) -> dict:
-        """Return dictionary of supported language codes"""
-        return {
-            "id": "Indonesian",
-            "en": "English",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "zh": "Chinese",
-            "ar": "Arabic",
-            "es": "Spanish",
-            "fr": "French",
-            "de": "German",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "ru": "Russian",
-            "hi": "Hindi",
-            "th": "Thai",
-            "vi": "Vietnamese",
-            "ms": "Malay",
-            "nl": "Dutch",
-            "pl": "Polish",
-            "sv": "Swedish",
-            "tr": "Turkish",
-        }
+    def get_supported_languages(self) -> MappingProxyType:
+        """Return a read-only mapping of supported language codes to names"""
+        return _LANGUAGE_NAMES
 
 
 if __name__ == "__main__":
-    # Quick test - needs an audio file
+    # Quick test - needs one or more audio files
     import sys
 
     if len(sys.argv) > 1:
         transcriber = Transcriber()
-        segments = transcriber.transcribe(sys.argv[1])
-        print(f"Segments: {len(segments)}")
-        for i, seg in enumerate(segments[:3], 1):
-            print(f"{i}. [{seg['start']:.1f}s - {seg['end']:.1f}s] {seg['text']}")
+        for path, segments in zip(sys.argv[1:], transcriber.transcribe_many(sys.argv[1:])):
+            print(f"{os.path.basename(path)} - Segments: {len(segments)}")
+            for i, seg in enumerate(segments[:3], 1):
+                print(f"{i}. [{seg['start']:.1f}s - {seg['end']:.1f}s] {seg['text']}")
     else:
-        print("Usage: python transcriber.py <audio_file.wav>")
+        print("Usage: python transcriber.py <audio_file.wav> [more_files.wav ...]")
@@ -7,13 +7,49 @@ Adapted from Autosub's approach: analyze RMS energy per audio frame,
 use percentile threshold to distinguish speech from silence.
 """
 
+import array
+import functools
 import math
+import operator
+import os
+import re
 import struct
+import subprocess
+import sys
+import threading
 import wave
 
+try:
+    import numpy as np
+except ImportError:  # vad.py also runs standalone without NumPy
+    np = None
+
+try:
+    import numpy_rms  # SIMD windowed RMS over float32 arrays
+    _HAS_NUMPY_RMS = np is not None
+except ImportError:
+    _HAS_NUMPY_RMS = False
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = np is not None
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    from audio_loader import wav_pcm_layout
+except ImportError:  # audio_loader needs pydub; WAV paths then go through wave
+    wav_pcm_layout = None
+
+_SILENCE_RE = re.compile(r"silence_(start|end): (\S+)")
+
+# WAV files are read in blocks of about this many bytes rather than one
+# readframes() call per analysis chunk
+_READ_BLOCK_BYTES = 16 << 20
+
 
 def _percentile(arr, percent):
-    """Calculate percentile value from sorted array"""
+    """Calculate percentile value from sorted array (used without NumPy)"""
     arr = sorted(arr)
     k = (len(arr) - 1) * percent
     f = math.floor(k)
@@ -25,32 +61,302 @@ def _percentile(arr, percent):
     return d0 + d1
 
 
-def _rms_energy(data, sample_width):
-    """Calculate RMS energy of audio data"""
-    if sample_width == 2:
-        fmt = "<%dh" % (len(data) // 2)
-        samples = struct.unpack(fmt, data)
-    elif sample_width == 1:
-        samples = [s - 128 for s in data]
-    elif sample_width == 4:
-        fmt = "<%di" % (len(data) // 4)
-        samples = struct.unpack(fmt, data)
+def _energy_quantile(energies, percent):
+    """
+    Linear-interpolated percentile of non-negative energies, equal to
+    np.quantile. Energies are first quantized to uint16 levels and counted,
+    which finds the level holding the wanted order statistics; the exact
+    selection then only runs on the few energies at that level.
+    """
+    n = energies.size
+    k = (n - 1) * percent
+    f = int(k)
+    t = k - f
+    top = energies.max()
+    if not top > 0:
+        return float(top)
+
+    # Quantizing is monotonic, so order statistics keep their level order
+    levels = min(65535, n)
+    q = (energies * (levels / top)).astype(np.uint16)
+    counts = np.cumsum(np.bincount(q, minlength=levels + 1))
+    lo = int(np.searchsorted(counts, f, side="right"))
+    hi = int(np.searchsorted(counts, f + 1, side="right")) if t > 0 else lo
+    candidates = energies[(q >= lo) & (q <= hi)] if hi > lo else energies[q == lo]
+    i = f - (int(counts[lo - 1]) if lo else 0)
+    if t == 0:
+        return float(np.partition(candidates, i)[i])
+
+    part = np.partition(candidates, (i, i + 1))
+    a, b = part[i], part[i + 1]
+    # Same interpolation as np.quantile
+    if t >= 0.5:
+        return float(b - (b - a) * (1 - t))
+    return float(a + (b - a) * t)
+
+
+# Little-endian PCM sample types by sample width (8-bit WAV is unsigned)
+_PCM_DTYPES = {1: "u1", 2: "<i2", 4: "<i4"}
+
+# Per-thread scratch arrays reused across find_speech_regions() calls
+_scratch = threading.local()
+
+
+# Maps unsigned 8-bit PCM bytes to the same value - 128 as signed bytes
+_U8_TO_S8 = bytes(i ^ 0x80 for i in range(256))
+
+# array.array type codes for little-endian signed PCM samples
+_ARRAY_CODES = {
+    size: code
+    for size, code in ((4, "l"), (4, "i"), (2, "h"))
+    if array.array(code).itemsize == size
+}
+
+
+def _make_rms(sample_width, channels):
+    """
+    Build the pure-Python RMS function for one fixed sample format.
+    Decoding and channel handling are chosen here once, not per chunk.
+    """
+    if sample_width == 1:
+        def decode(data):
+            # Unsigned to signed: flipping the top bit is the same as - 128
+            return array.array("b", data.translate(_U8_TO_S8))
+    elif sample_width in _ARRAY_CODES:
+        code = _ARRAY_CODES[sample_width]
+
+        def decode(data):
+            samples = array.array(code, data)
+            if sys.byteorder == "big":
+                samples.byteswap()
+            return samples
     else:
-        return 0
+        def rms(data):
+            return 0
+        return rms
+
+    if channels == 1:
+        def rms(data):
+            samples = decode(data)
+            if not samples:
+                return 0
+            return math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples))
+    elif channels == 2:
+        def rms(data):
+            samples = decode(data)
+            samples = list(map(operator.add, samples[0::2], samples[1::2]))
+            if not samples:
+                return 0
+            return math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples)) / 2
+    else:
+        # Stream one frame at a time with a running sum instead of
+        # materializing the samples and the per-frame sums
+        frame = struct.Struct("<%d%s" % (channels, "Bhi"[sample_width // 2]))
+        offset = 128 * channels if sample_width == 1 else 0
+
+        def rms(data):
+            sum_sq = n = 0
+            for samples in frame.iter_unpack(data[:len(data) - len(data) % frame.size]):
+                s = sum(samples) - offset
+                sum_sq += s * s
+                n += 1
+            if not n:
+                return 0
+            return math.sqrt(sum_sq / n) / channels
+
+    return rms
+
+
+# Specialized RMS functions for the common WAV formats, keyed by
+# (sample_width, channels)
+_RMS_DISPATCH = {key: _make_rms(*key) for key in ((1, 1), (2, 1), (2, 2), (4, 1))}
+
+
+def _rms_function(sample_width, channels):
+    """Pure-Python RMS function for this sample format"""
+    rms = _RMS_DISPATCH.get((sample_width, channels))
+    return rms if rms is not None else _make_rms(sample_width, channels)
+
+
+def _frame_energies(samples, frame_width, n_chunks, out=None):
+    """
+    RMS energy per chunk of frame_width frames, computed with NumPy.
+    samples is (n_frames,) or (n_frames, channels); channels are averaged.
+    Works on blocks of chunks so long files never need a full float copy.
+    Energies are written to out (float64, n_chunks long) when given.
+    """
+    channels = samples.shape[1] if samples.ndim > 1 else 1
+    frames = samples[: n_chunks * frame_width].reshape(n_chunks, frame_width, channels)
+    # 8/16-bit squares summed over a chunk fit in int64: exact, no float copy
+    exact = frames.dtype.kind in "iu" and frames.dtype.itemsize <= 2
+    energies = np.empty(n_chunks, dtype=np.float64) if out is None else out
+    step = max(1, (1 << 20) // (frame_width * channels))
+    for i in range(0, n_chunks, step):
+        block = frames[i:i + step]
+        part = energies[i:i + step]
+        if channels > 1:
+            block = block.sum(axis=2, dtype=np.int32 if exact else np.float64)
+        else:
+            block = block[:, :, 0]
+        if _HAS_NUMPY_RMS:
+            part[:] = numpy_rms.rms(block.astype(np.float32).ravel(), window_size=frame_width)
+        else:
+            if exact:
+                part[:] = np.einsum("ij,ij->i", block, block, dtype=np.int64)
+            else:
+                np.einsum("ij,ij->i", block, block, dtype=np.float64, out=part)
+            part /= frame_width
+            np.sqrt(part, out=part)
+        if channels > 1:
+            part /= channels
+    return energies
+
+
+def _energy_buffer(n_chunks, out=None):
+    """
+    Float64 buffer for n_chunks chunk energies.
+
+    Without out, a per-thread scratch array is reused across calls and only
+    grows, so repeated VAD runs do not allocate a fresh energies array.
+    """
+    if out is not None:
+        if out.dtype != np.float64 or out.ndim != 1 or out.size < n_chunks:
+            raise ValueError(f"out must be a 1-D float64 array of at least {n_chunks} elements")
+        return out[:n_chunks]
+    buffer = getattr(_scratch, "energies", None)
+    if buffer is None or buffer.size < n_chunks:
+        buffer = _scratch.energies = np.empty(max(n_chunks, 2 * (buffer.size if buffer is not None else 0)))
+    return buffer[:n_chunks]
+
+
+def _chunk_count(seconds, chunk_duration):
+    """Smallest number of chunks that lasts at least `seconds`"""
+    n = max(0, math.ceil(seconds / chunk_duration))
+    if n > 0 and (n - 1) * chunk_duration >= seconds:
+        n -= 1
+    return n
+
+
+@functools.lru_cache(maxsize=8)
+def _chunk_times(n_chunks, chunk_duration):
+    """Start time of every chunk boundary, index * chunk_duration
+
+    Computed once per (n_chunks, chunk_duration) instead of accumulating
+    elapsed time chunk by chunk, so region times carry no float drift.
+    """
+    times = np.arange(n_chunks + 1, dtype=np.float64) * chunk_duration
+    times.flags.writeable = False
+    return times
+
+
+def _speech_runs(mask, min_chunks, max_chunks):
+    """
+    Vectorized version of the region scan in find_speech_regions.
 
-    if not samples:
-        return 0
+    Runs of speech chunks are split into pieces of max_chunks chunks. As in
+    the scalar scan, the chunk where a piece hits the maximum closes it and
+    is not part of the next piece. Pieces shorter than min_chunks are dropped.
 
-    sum_sq = sum(s * s for s in samples)
-    return math.sqrt(sum_sq / len(samples))
+    Returns:
+        Tuple of (starts, ends) arrays of chunk indices, end exclusive
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+    run_lengths = run_ends - run_starts
+
+    # A region is checked against the maximum from its second chunk on
+    max_chunks = max(1, max_chunks)
+    stride = max_chunks + 1
+    full = run_lengths // stride  # pieces of max_chunks chunks per run
+    rest_starts = run_starts + full * stride
+    rest_lengths = run_ends - rest_starts
+
+    # Full-length pieces, laid out with np.repeat
+    n_full = int(full.sum()) if max_chunks >= min_chunks else 0
+    if n_full:
+        nth = np.arange(n_full) - np.repeat(np.cumsum(full) - full, full)
+        full_starts = np.repeat(run_starts, full) + nth * stride
+    else:
+        full_starts = run_starts[:0]
+
+    keep = rest_lengths >= max(1, min_chunks)
+    starts = np.concatenate((full_starts, rest_starts[keep]))
+    ends = np.concatenate((full_starts + max_chunks, run_ends[keep]))
+    order = np.argsort(starts, kind="stable")
+    return starts[order], ends[order]
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _rms_series(samples, frame_width, channels, energies):
+        """
+        Per-chunk RMS of interleaved 8/16-bit PCM into energies, with the
+        chunks spread over all cores. Squares are summed exactly in int64.
+        """
+        for i in prange(energies.size):
+            acc = 0
+            for j in range(i * frame_width, (i + 1) * frame_width):
+                # Channel sum of one frame; the average is taken after the sqrt
+                v = np.int64(0)
+                for c in range(j * channels, (j + 1) * channels):
+                    v += samples[c]
+                acc += v * v
+            energies[i] = np.sqrt(acc / frame_width) / channels
+
+    @njit(cache=True, fastmath=True)
+    def _vad_core(samples, frame_width, channels, n_chunks, min_chunks, max_chunks, pct, energies):
+        """
+        Energy VAD in compiled code: per-chunk RMS (parallel), percentile
+        threshold and region scan. Same results as the NumPy path.
+        energies is the n_chunks long float64 buffer for the chunk energies.
+
+        Returns:
+            (n_regions, 2) array of [start, end) chunk indices
+        """
+        _rms_series(samples, frame_width, channels, energies)
+
+        # Linear-interpolated percentile, interpolating like np.quantile
+        k = (n_chunks - 1) * pct
+        f = int(np.floor(k))
+        t = k - f
+        part = np.partition(energies, f)
+        threshold = part[f]
+        if t > 0:
+            b = part[f + 1:].min()
+            if t >= 0.5:
+                threshold = b - (b - threshold) * (1 - t)
+            else:
+                threshold = threshold + (b - threshold) * t
+
+        max_chunks = max(1, max_chunks)
+        regions = np.empty((n_chunks, 2), dtype=np.int64)
+        n = 0
+        start = -1
+        for i in range(n_chunks):
+            speech = energies[i] > threshold
+            if start >= 0 and (not speech or i - start >= max_chunks):
+                if i - start >= min_chunks:
+                    regions[n, 0] = start
+                    regions[n, 1] = i
+                    n += 1
+                start = -1
+            elif start < 0 and speech:
+                start = i
+        if start >= 0 and n_chunks - start >= min_chunks:
+            regions[n, 0] = start
+            regions[n, 1] = n_chunks
+            n += 1
+        return regions[:n]
 
 
 def find_speech_regions(
-    wav_path,
+    audio,
     frame_width=4096,
     min_region_size=0.5,
     max_region_size=6.0,
     energy_threshold_percentile=0.2,
+    sample_rate=None,
+    out=None,
 ):
     """
     Detect speech regions in a WAV file using energy-based VAD.
@@ -60,69 +366,244 @@ def find_speech_regions(
     grouped into regions.
 
     Args:
-        wav_path: Path to WAV audio file
+        audio: Path to WAV audio file, or a NumPy array of PCM samples
+            shaped (n_frames,) or (n_frames, channels)
         frame_width: Number of audio frames per analysis chunk
         min_region_size: Minimum speech region duration in seconds
         max_region_size: Maximum speech region duration in seconds
         energy_threshold_percentile: Percentile of energy values to use as
             silence threshold (0.2 = bottom 20% is silence)
+        sample_rate: Sample rate in Hz (required when audio is an array)
+        out: Optional 1-D float64 array, at least one element per chunk, to
+            hold the chunk energies. By default a per-thread scratch buffer
+            is reused across calls.
 
     Returns:
         List of (start_sec, end_sec) tuples for each speech region
     """
-    reader = wave.open(wav_path, "rb")
-    sample_width = reader.getsampwidth()
-    rate = reader.getframerate()
-    n_channels = reader.getnchannels()
-    total_frames = reader.getnframes()
-
-    total_duration = total_frames / rate
-    chunk_duration = float(frame_width) / rate
-    n_chunks = int(total_duration / chunk_duration)
+    if np is not None and isinstance(audio, np.ndarray):
+        if sample_rate is None:
+            raise ValueError("sample_rate is required when passing PCM samples")
+
+        total_duration = len(audio) / sample_rate
+        chunk_duration = float(frame_width) / sample_rate
+        n_chunks = int(total_duration / chunk_duration)
+
+        if n_chunks == 0:
+            return [(0, total_duration)]
+
+        # int64 sums of squares are exact for 8/16-bit PCM only; wider
+        # samples can overflow them and take the float64 NumPy path
+        if _HAS_NUMBA and audio.dtype.kind in "iu" and audio.dtype.itemsize <= 2:
+            channels = audio.shape[1] if audio.ndim > 1 else 1
+            regions = _vad_core(
+                audio.reshape(-1),
+                frame_width,
+                channels,
+                n_chunks,
+                _chunk_count(min_region_size, chunk_duration),
+                _chunk_count(max_region_size, chunk_duration),
+                energy_threshold_percentile,
+                _energy_buffer(n_chunks, out),
+            )
+            times = _chunk_times(n_chunks, chunk_duration)
+            return list(zip(times[regions[:, 0]].tolist(), times[regions[:, 1]].tolist()))
+
+        energies = _frame_energies(audio, frame_width, n_chunks, out=_energy_buffer(n_chunks, out))
+    else:
+        layout = None
+        if np is not None and wav_pcm_layout is not None and isinstance(audio, (str, os.PathLike)):
+            try:
+                layout = wav_pcm_layout(audio)
+            except (OSError, ValueError):
+                pass  # left to the wave module, which reports what is wrong
+
+        if layout is not None and layout[2] in _PCM_DTYPES and layout[1] > 0:
+            # Map the data chunk and analyze it in place, no readframes() copies
+            rate, n_channels, sample_width, offset, size = layout
+            total_frames = size // (sample_width * n_channels)
+            if total_frames == 0:
+                return [(0, 0.0)]
+            samples = np.memmap(
+                audio, dtype=_PCM_DTYPES[sample_width], mode="r",
+                offset=offset, shape=(total_frames, n_channels),
+            )
+            if sample_width == 1:
+                samples = samples.astype(np.int16) - 128
+            return find_speech_regions(
+                samples, frame_width, min_region_size, max_region_size,
+                energy_threshold_percentile, sample_rate=rate, out=out,
+            )
+
+        reader = wave.open(audio, "rb")
+        sample_width = reader.getsampwidth()
+        rate = reader.getframerate()
+        n_channels = reader.getnchannels()
+        total_frames = reader.getnframes()
+
+        total_duration = total_frames / rate
+        chunk_duration = float(frame_width) / rate
+        n_chunks = int(total_duration / chunk_duration)
+
+        if n_chunks == 0:
+            reader.close()
+            return [(0, total_duration)]
+
+        # Calculate energy for each chunk, reading many chunks per call.
+        # Samples are decoded at their own width and channels are averaged.
+        chunk_bytes = frame_width * n_channels * sample_width
+        chunks_per_read = max(1, _READ_BLOCK_BYTES // chunk_bytes)
+        dtype = _PCM_DTYPES.get(sample_width) if np is not None else None
+        energies = _energy_buffer(n_chunks, out) if dtype is not None else []
+        rms = _rms_function(sample_width, n_channels)
+        filled = 0
+        for first in range(0, n_chunks, chunks_per_read):
+            raw = reader.readframes(min(chunks_per_read, n_chunks - first) * frame_width)
+            got = len(raw) // chunk_bytes
+            if dtype is not None:
+                if got:
+                    samples = np.frombuffer(raw, dtype=dtype, count=got * chunk_bytes // sample_width)
+                    if sample_width == 1:
+                        samples = samples.astype(np.int16) - 128
+                    _frame_energies(
+                        samples.reshape(-1, n_channels), frame_width, got,
+                        out=energies[filled:filled + got],
+                    )
+            else:
+                energies.extend(
+                    rms(raw[i:i + chunk_bytes])
+                    for i in range(0, got * chunk_bytes, chunk_bytes)
+                )
+            filled += got
+            if got < chunks_per_read:
+                break
 
-    if n_chunks == 0:
         reader.close()
+        energies = energies[:filled]
+
+    if len(energies) == 0:
         return [(0, total_duration)]
 
-    # Calculate energy for each chunk
-    energies = []
-    for _ in range(n_chunks):
-        chunk = reader.readframes(frame_width)
-        if not chunk:
-            break
-        energies.append(_rms_energy(chunk, sample_width * n_channels))
+    # Determine silence threshold from energy distribution
+    if isinstance(energies, list):
+        threshold = _percentile(energies, energy_threshold_percentile)
+    else:
+        threshold = _energy_quantile(energies, energy_threshold_percentile)
+
+    if not isinstance(energies, list):
+        starts, ends = _speech_runs(
+            energies > threshold,
+            _chunk_count(min_region_size, chunk_duration),
+            _chunk_count(max_region_size, chunk_duration),
+        )
+        times = _chunk_times(len(energies), chunk_duration)
+        return list(zip(times[starts].tolist(), times[ends].tolist()))
+
+    # Find speech regions (fallback without NumPy). Works in chunk indices
+    # like _speech_runs, with the region state kept in one integer:
+    # start is -1 while no region is open.
+    min_chunks = _chunk_count(min_region_size, chunk_duration)
+    max_chunks = max(1, _chunk_count(max_region_size, chunk_duration))
+    regions = []
+    start = -1
 
-    reader.close()
+    for i, energy in enumerate(energies):
+        is_open = start >= 0
+        is_speech = energy > threshold
+        close = is_open and (not is_speech or i - start >= max_chunks)
 
-    if not energies:
-        return [(0, total_duration)]
+        if close and i - start >= min_chunks:
+            regions.append((start * chunk_duration, i * chunk_duration))
 
-    # Determine silence threshold from energy distribution
-    threshold = _percentile(energies, energy_threshold_percentile)
+        # Closed regions reset; an idle scan opens on speech; otherwise unchanged
+        start = -1 if close else (i if not is_open and is_speech else start)
 
-    # Find speech regions
-    elapsed_time = 0.0
-    regions = []
-    region_start = None
+    # Close any open region at the end
+    end = len(energies)
+    if start >= 0 and end - start >= min_chunks:
+        regions.append((start * chunk_duration, end * chunk_duration))
 
-    for energy in energies:
-        is_silence = energy <= threshold
-        max_exceeded = region_start is not None and (elapsed_time - region_start) >= max_region_size
+    return regions
 
-        if (max_exceeded or is_silence) and region_start is not None:
-            if (elapsed_time - region_start) >= min_region_size:
-                regions.append((region_start, elapsed_time))
-            region_start = None
 
-        elif region_start is None and not is_silence:
-            region_start = elapsed_time
+def find_silence_ffmpeg(wav_path, noise_db=-30, min_dur=0.5):
+    """
+    Detect silent intervals with FFmpeg's silencedetect filter.
 
-        elapsed_time += chunk_duration
+    Args:
+        wav_path: Path to audio file
+        noise_db: Noise level (dB) below which audio counts as silence
+        min_dur: Minimum silence duration in seconds
 
-    # Close any open region at the end
-    if region_start is not None:
-        if (elapsed_time - region_start) >= min_region_size:
-            regions.append((region_start, elapsed_time))
+    Returns:
+        List of (start_sec, end_sec) tuples for each silent interval.
+        end_sec is None when the silence runs until the end of the file.
+
+    Raises:
+        RuntimeError: If FFmpeg fails to analyze the file
+    """
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", "-i", wav_path,
+        "-af", f"silencedetect=noise={noise_db}dB:d={min_dur}",
+        "-f", "null", "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg silencedetect failed: {result.stderr.strip()[-200:]}")
+
+    silences = []
+    silence_start = None
+    for kind, value in _SILENCE_RE.findall(result.stderr):
+        if kind == "start":
+            silence_start = max(0.0, float(value))
+        elif silence_start is not None:
+            silences.append((silence_start, float(value)))
+            silence_start = None
+
+    if silence_start is not None:
+        silences.append((silence_start, None))
+
+    return silences
+
+
+def find_speech_regions_ffmpeg(
+    wav_path,
+    duration,
+    noise_db=-30,
+    min_silence=0.5,
+    min_region_size=0.5,
+    max_region_size=6.0,
+):
+    """
+    Detect speech regions as the complement of FFmpeg-detected silence.
+
+    Regions longer than max_region_size are split so the output can be
+    grouped exactly like find_speech_regions() output.
+
+    Args:
+        wav_path: Path to audio file
+        duration: Total audio duration in seconds
+        noise_db: Noise level (dB) below which audio counts as silence
+        min_silence: Minimum silence duration in seconds
+        min_region_size: Minimum speech region duration in seconds
+        max_region_size: Maximum speech region duration in seconds
+
+    Returns:
+        List of (start_sec, end_sec) tuples for each speech region
+    """
+    silences = find_silence_ffmpeg(wav_path, noise_db, min_silence)
+
+    regions = []
+    position = 0.0
+    for silence_start, silence_end in silences + [(duration, None)]:
+        start, end = position, min(silence_start, duration)
+        while end - start >= min_region_size:
+            region_end = min(start + max_region_size, end)
+            regions.append((start, region_end))
+            start = region_end
+        if silence_end is None:
+            break
+        position = silence_end
 
     return regions
 
@@ -174,6 +655,36 @@ def group_regions(regions, max_group_duration=30.0, max_gap=2.0):
     return groups
 
 
+def chunk_with_overlap(duration, chunk=35.0, overlap=1.0):
+    """
+    Split a duration into fixed-length windows that overlap slightly.
+
+    Chunk boundaries are not tied to silence, so words cut at one boundary
+    are still whole in the neighbouring chunk's overlap.
+
+    Args:
+        duration: Total audio duration in seconds
+        chunk: Window length in seconds
+        overlap: Overlap between consecutive windows in seconds
+
+    Returns:
+        List of (start_sec, end_sec) tuples, e.g. [(0, 35), (34, 69), ...]
+    """
+    step = chunk - overlap
+    if step <= 0:
+        raise ValueError("chunk must be longer than overlap")
+
+    chunks = []
+    start = 0.0
+    while start < duration:
+        end = min(start + chunk, duration)
+        chunks.append((start, end))
+        if end >= duration:
+            break
+        start += step
+    return chunks
+
+
 def regions_to_segments(regions, texts):
     """
     Combine VAD regions with transcription texts into SRT segments.
@@ -187,11 +698,12 @@ def regions_to_segments(regions, texts):
     """
     segments = []
     for (start, end), text in zip(regions, texts):
-        if text and text.strip():
+        text = text.strip() if text else ""
+        if text:
             segments.append({
                 "start": round(start, 3),
                 "end": round(end, 3),
-                "text": text.strip(),
+                "text": text,
             })
     return segments
 